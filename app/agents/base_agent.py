@@ -4,6 +4,7 @@ from app.models.pydantic_models import ProcessingResult, ValidationResult
 import logging
 import uuid
 from datetime import datetime
+from functools import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,11 @@ class BaseAgent(ABC):
         """Return list of agent capabilities"""
         pass
     
+    @cached_property
+    def capabilities_preview(self) -> str:
+        """First three capabilities joined for display, built on first access"""
+        return ", ".join(self.get_capabilities()[:3])
+    
     def log_action(self, action: str, details: Dict[str, Any]):
         """Log agent actions for audit purposes"""
         log_entry = {
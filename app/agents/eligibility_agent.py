@@ -8,10 +8,29 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 import joblib
 import os
+from bisect import bisect_right
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Feature bands: ascending cut-offs and the value for each band (below the first cut-off, then at/above each)
+INCOME_STABILITY_BANDS = ((12, 24), (0.8, 0.5, 0.2))
+EMPLOYMENT_STABILITY_BANDS = ((6, 18, 36), (0.9, 0.6, 0.3, 0.1))
+BALANCE_CONSISTENCY_BANDS = ((12, 24), (0.4, 0.6, 0.8))
+CREDIT_EMPLOYMENT_BONUS_BANDS = ((12, 24), (0, 25, 50))
+CREDIT_INCOME_BONUS_BANDS = ((2500, 4000), (0, 15, 30))
+CREDIT_BASE_SCORE = 650
+
+def _band(value, bands):
+    """Look up the band value for a scalar"""
+    cut_offs, values = bands
+    return values[bisect_right(cut_offs, value)]
+
+def _band_batch(values: np.ndarray, bands) -> np.ndarray:
+    """Look up the band value for every element of an array"""
+    cut_offs, band_values = bands
+    return np.asarray(band_values)[np.searchsorted(cut_offs, values, side='right')]
+
 class EligibilityAgent(BaseAgent):
     """Agent responsible for making eligibility decisions using ML models"""
     
@@ -245,27 +264,45 @@ class EligibilityAgent(BaseAgent):
             logger.error(f"Feature engineering failed: {e}")
             raise
     
+    def batch_features(self, applicants: List[Dict[str, Any]]) -> np.ndarray:
+        """Engineer the feature matrix for many applicants at once, one row per applicant in feature_names order"""
+        monthly_income = np.array([float(a.get('monthly_income', 0)) for a in applicants])
+        employment_length = np.array([int(a.get('employment_length_months', 0)) for a in applicants])
+        family_size = np.array([int(a.get('family_size', 1)) for a in applicants])
+        dependents = np.array([int(a.get('dependents', 0)) for a in applicants])
+        
+        # Same rules as _calculate_debt_to_income_ratio, guarding the division for non-positive incomes
+        positive_income = monthly_income > 0
+        debt_to_income_ratio = np.where(
+            positive_income,
+            np.minimum(family_size * 200 / np.where(positive_income, monthly_income, 1.0), 1.0),
+            1.0
+        )
+        
+        return np.column_stack([
+            monthly_income, employment_length, family_size, dependents,
+            self._calculate_income_stability_batch(employment_length),
+            self._calculate_employment_stability_batch(employment_length),
+            debt_to_income_ratio,
+            self._estimate_credit_score_batch(monthly_income, employment_length),
+            self._calculate_balance_consistency_batch(employment_length)
+        ])
+    
     def _calculate_income_stability(self, data: Dict[str, Any]) -> float:
         """Calculate income stability score"""
-        employment_length = data.get('employment_length_months', 0)
-        if employment_length >= 24:
-            return 0.2
-        elif employment_length >= 12:
-            return 0.5
-        else:
-            return 0.8
+        return _band(data.get('employment_length_months', 0), INCOME_STABILITY_BANDS)
     
     def _calculate_employment_stability(self, data: Dict[str, Any]) -> float:
         """Calculate employment stability score"""
-        employment_length = data.get('employment_length_months', 0)
-        if employment_length >= 36:
-            return 0.1
-        elif employment_length >= 18:
-            return 0.3
-        elif employment_length >= 6:
-            return 0.6
-        else:
-            return 0.9
+        return _band(data.get('employment_length_months', 0), EMPLOYMENT_STABILITY_BANDS)
+    
+    def _calculate_income_stability_batch(self, employment_length: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_income_stability over an array of employment lengths"""
+        return _band_batch(employment_length, INCOME_STABILITY_BANDS)
+    
+    def _calculate_employment_stability_batch(self, employment_length: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_employment_stability over an array of employment lengths"""
+        return _band_batch(employment_length, EMPLOYMENT_STABILITY_BANDS)
     
     def _calculate_debt_to_income_ratio(self, data: Dict[str, Any]) -> float:
         """Calculate debt to income ratio"""
@@ -275,31 +312,29 @@ class EligibilityAgent(BaseAgent):
     
     def _estimate_credit_score(self, data: Dict[str, Any]) -> float:
         """Estimate credit score based on available information"""
-        base_score = 650
-        
-        employment_length = data.get('employment_length_months', 0)
-        if employment_length >= 24:
-            base_score += 50
-        elif employment_length >= 12:
-            base_score += 25
-        
-        monthly_income = data.get('monthly_income', 0)
-        if monthly_income >= 4000:
-            base_score += 30
-        elif monthly_income >= 2500:
-            base_score += 15
-        
+        base_score = (
+            CREDIT_BASE_SCORE
+            + _band(data.get('employment_length_months', 0), CREDIT_EMPLOYMENT_BONUS_BANDS)
+            + _band(data.get('monthly_income', 0), CREDIT_INCOME_BONUS_BANDS)
+        )
         return max(300, min(850, base_score))
     
+    def _estimate_credit_score_batch(self, monthly_income: np.ndarray, employment_length: np.ndarray) -> np.ndarray:
+        """Vectorized _estimate_credit_score over arrays of incomes and employment lengths"""
+        base_score = (
+            float(CREDIT_BASE_SCORE)
+            + _band_batch(employment_length, CREDIT_EMPLOYMENT_BONUS_BANDS)
+            + _band_batch(monthly_income, CREDIT_INCOME_BONUS_BANDS)
+        )
+        return np.clip(base_score, 300, 850)
+    
     def _calculate_balance_consistency(self, data: Dict[str, Any]) -> float:
         """Calculate monthly balance consistency score"""
-        employment_length = data.get('employment_length_months', 0)
-        if employment_length >= 24:
-            return 0.8
-        elif employment_length >= 12:
-            return 0.6
-        else:
-            return 0.4
+        return _band(data.get('employment_length_months', 0), BALANCE_CONSISTENCY_BANDS)
+    
+    def _calculate_balance_consistency_batch(self, employment_length: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_balance_consistency over an array of employment lengths"""
+        return _band_batch(employment_length, BALANCE_CONSISTENCY_BANDS)
     
     async def _make_prediction(self, features: np.ndarray) -> ModelPrediction:
         """Make prediction using the trained model"""
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from app.agents.base_agent import BaseAgent
 from app.agents.extraction_agent import ExtractionAgent
 from app.agents.validation_agent import ValidationAgent
@@ -8,6 +8,7 @@ import logging
 import asyncio
 from datetime import datetime
 import uuid
+from functools import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,21 @@ class MasterAgent(BaseAgent):
             'validation', 
             'eligibility'
         ]
+        # (step, agent name, capabilities preview) per sub-agent, built once for display
+        self._capabilities_summary = tuple(
+            (name, agent.name, agent.capabilities_preview)
+            for name, agent in self.agents.items()
+        )
         
+    @cached_property
+    def workflow_steps_display(self) -> str:
+        """Workflow steps joined with arrows for display, built on first access"""
+        return " → ".join(self.workflow_steps)
+    
+    def capabilities_summary(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Return the precomputed (step, agent name, capabilities preview) of each sub-agent"""
+        return self._capabilities_summary
+    
     def get_capabilities(self) -> List[str]:
         return [
             "workflow_orchestration",
@@ -247,6 +262,8 @@ class MasterAgent(BaseAgent):
                     'decision': decision_data['prediction'],
                     'confidence': decision_data['confidence'],
                     'explanation': self._generate_decision_explanation(decision_data),
+                    'features': decision_data.get('features', []),
+                    'shap_values': decision_data.get('shap_values', {}),
                     'recommendations': self._generate_recommendations(decision_data)
                 }
         
@@ -1,13 +1,24 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+from typing import Any, List, Mapping, Optional
+import asyncio
+import hashlib
 import logging
+import orjson
+import os
+import re
+import time
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 
 from app.core.config import settings
-from app.core.database import init_db, get_db
+from app.core.database import init_db, get_db, engine, SessionLocal
 from app.agents.master_agent import MasterAgent
 from app.models.pydantic_models import (
     ApplicationSubmission, ChatMessage, ApplicationStatusResponse,
@@ -15,6 +26,68 @@ from app.models.pydantic_models import (
 )
 from app.models.database_models import Applicant, Document, ExtractedData, Decision
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+class ApplicationForm(BaseModel):
+    """Applicant form fields submitted alongside documents to /ingest"""
+
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    email: str
+    phone: str
+    street_address: str
+    city: str
+    state: str
+    postal_code: str
+    country: str
+    monthly_income: float
+    employment_status: str
+    employer_name: Optional[str] = None
+    employment_length_months: Optional[int] = None
+    family_size: int
+    dependents: int
+
+    @classmethod
+    def as_form(
+        cls,
+        first_name: str = Form(...),
+        last_name: str = Form(...),
+        date_of_birth: date = Form(...),
+        email: str = Form(...),
+        phone: str = Form(...),
+        street_address: str = Form(...),
+        city: str = Form(...),
+        state: str = Form(...),
+        postal_code: str = Form(...),
+        country: str = Form(...),
+        monthly_income: float = Form(...),
+        employment_status: str = Form(...),
+        employer_name: Optional[str] = Form(None),
+        employment_length_months: Optional[int] = Form(None),
+        family_size: int = Form(...),
+        dependents: int = Form(...)
+    ) -> "ApplicationForm":
+        """Build the model from multipart form fields"""
+        # FastAPI has already coerced and validated each Form field, so skip a second validation pass
+        return cls.model_construct(
+            first_name=first_name,
+            last_name=last_name,
+            date_of_birth=date_of_birth,
+            email=email,
+            phone=phone,
+            street_address=street_address,
+            city=city,
+            state=state,
+            postal_code=postal_code,
+            country=country,
+            monthly_income=monthly_income,
+            employment_status=employment_status,
+            employer_name=employer_name,
+            employment_length_months=employment_length_months,
+            family_size=family_size,
+            dependents=dependents
+        )
 
 # Configure logging
 logging.basicConfig(level=getattr(logging, settings.log_level))
@@ -24,13 +97,14 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Social Support Application Evaluation AI",
     description="AI-powered system for evaluating social support applications",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -39,21 +113,56 @@ app.add_middleware(
 # Initialize master agent
 master_agent = MasterAgent()
 
+# Read size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 16
+
+# Document types with dedicated size thresholds in the fallback validation
+TEXT_EXTS = frozenset({"txt", "csv"})
+IMAGE_EXTS = frozenset({"jpg", "jpeg", "png"})
+
+# file_type -> (minimum size in bytes, score penalty, issue template)
+DOCUMENT_SIZE_RULES = {
+    **dict.fromkeys(TEXT_EXTS, (100, 20, "Document {} suspiciously small")),
+    **dict.fromkeys(IMAGE_EXTS, (5000, 25, "Image document {} too small - may be fake")),
+    "pdf": (10000, 20, "PDF document {} too small - may be corrupted"),
+}
+# Generic threshold for any type without a dedicated rule
+DEFAULT_SIZE_RULE = (1000, 20, "Document {} suspiciously small")
+
+# Prefer time-ordered uuid7 where the interpreter provides it
+_new_uuid = getattr(uuid, "uuid7", uuid.uuid4)
+
+# (monotonic refresh time, ISO timestamp) shared by the health endpoints
+_timestamp_cache = (0.0, "")
+
+def _cached_utc_timestamp() -> str:
+    """Return the current UTC ISO timestamp, re-formatted at most once per second"""
+    global _timestamp_cache
+    now = time.monotonic()
+    if now - _timestamp_cache[0] > 1.0:
+        _timestamp_cache = (now, datetime.utcnow().isoformat())
+    return _timestamp_cache[1]
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup"""
     try:
+        # Size the default executor for concurrent blocking I/O
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=settings.io_thread_pool_workers, thread_name_prefix="io")
+        )
+        
         # Try to initialize database but don't fail if it's not available
         try:
             init_db()
             logger.info("Database initialized successfully")
         except Exception as db_error:
-            logger.warning(f"Database initialization failed (running in demo mode): {db_error}")
+            logger.warning("Database initialization failed (running in demo mode): %s", db_error)
             logger.info("Application will run with limited functionality")
         
         logger.info("Application started successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize application: {e}")
+        logger.error("Failed to initialize application: %s", e)
         # Don't raise - let the app start in demo mode
         logger.info("Starting application in demo mode")
 
@@ -76,7 +185,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _cached_utc_timestamp(),
         "version": "1.0.0"
     }
 
@@ -85,35 +194,23 @@ async def test_endpoint():
     """Simple test endpoint"""
     return {
         "message": "Backend is working!",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _cached_utc_timestamp(),
         "status": "healthy"
     }
 
-@app.post("/ingest", response_model=dict)
+@app.post("/ingest")
 async def ingest_application(
-    first_name: str = Form(...),
-    last_name: str = Form(...),
-    date_of_birth: str = Form(...),
-    email: str = Form(...),
-    phone: str = Form(...),
-    street_address: str = Form(...),
-    city: str = Form(...),
-    state: str = Form(...),
-    postal_code: str = Form(...),
-    country: str = Form(...),
-    monthly_income: float = Form(...),
-    employment_status: str = Form(...),
-    employer_name: Optional[str] = Form(None),
-    employment_length_months: Optional[int] = Form(None),
-    family_size: int = Form(...),
-    dependents: int = Form(...),
+    background_tasks: BackgroundTasks,
+    form: ApplicationForm = Depends(ApplicationForm.as_form),
     files: List[UploadFile] = File([]),
+    background: bool = Query(False, description="Run the AI workflow after responding with 202"),
     db: Session = Depends(get_db)
 ):
     """Ingest application and supporting documents"""
+    email, phone, monthly_income = form.email, form.phone, form.monthly_income
     try:
         # Generate application ID
-        application_id = str(uuid.uuid4())
+        application_id = str(_new_uuid())
         
         # Process uploaded files first (always do this)
         documents = []
@@ -121,17 +218,23 @@ async def ingest_application(
             if file.size > settings.max_file_size:
                 raise HTTPException(status_code=400, detail=f"File {file.filename} too large")
             
-            # Save file
-            file_path = f"{settings.upload_dir}/{application_id}_{file.filename}"
+            # Save file, hashing and sizing the chunks as they are written
+            file_path = str(settings.upload_path / f"{application_id}_{file.filename}")
+            content_hash = hashlib.blake2b(digest_size=16)
+            file_size = 0
             with open(file_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    buffer.write(chunk)
+                    file_size += len(chunk)
             
+            _, ext = os.path.splitext(file.filename or "")
             documents.append({
                 'file_path': file_path,
-                'file_type': file.filename.split('.')[-1].lower(),
+                'file_type': ext.lstrip(".").lower(),
                 'filename': file.filename,
-                'file_size': file.size
+                'file_size': file_size,
+                'content_hash': content_hash.hexdigest()
             })
         
         # Try to save to database, but don't fail if it's not available
@@ -139,22 +242,7 @@ async def ingest_application(
             # Create applicant record
             applicant = Applicant(
                 id=application_id,
-                first_name=first_name,
-                last_name=last_name,
-                date_of_birth=datetime.strptime(date_of_birth, "%Y-%m-%d"),
-                email=email,
-                phone=phone,
-                street_address=street_address,
-                city=city,
-                state=state,
-                postal_code=postal_code,
-                country=country,
-                monthly_income=monthly_income,
-                employment_status=employment_status,
-                employer_name=employer_name,
-                employment_length_months=employment_length_months,
-                family_size=family_size,
-                dependents=dependents,
+                **form.model_dump(),
                 status="processing"
             )
             
@@ -174,35 +262,30 @@ async def ingest_application(
             
             db.commit()
             db.refresh(applicant)
-            logger.info(f"Application {application_id} saved to database successfully")
+            logger.info("Application %s saved to database successfully", application_id)
             
         except Exception as db_error:
-            logger.warning(f"Database save failed for {application_id}, continuing with AI processing: {db_error}")
+            logger.warning("Database save failed for %s, continuing with AI processing: %s", application_id, db_error)
             # Continue without database - we'll still process the AI workflow
         
         # Prepare data for processing
         processing_data = {
-            'application_data': {
-                'first_name': first_name,
-                'last_name': last_name,
-                'date_of_birth': date_of_birth,
-                'email': email,
-                'phone': phone,
-                'street_address': street_address,
-                'city': city,
-                'state': state,
-                'postal_code': postal_code,
-                'country': country,
-                'monthly_income': monthly_income,
-                'employment_status': employment_status,
-                'employer_name': employer_name,
-                'employment_length_months': employment_length_months,
-                'family_size': family_size,
-                'dependents': dependents,
-            },
+            'application_data': form.model_dump(mode="json"),
             'documents': documents  # Now documents is always available
         }
         
+        # Hand the workflow off and let the client poll /status
+        if background:
+            background_tasks.add_task(_run_workflow, application_id, processing_data)
+            return ORJSONResponse(
+                status_code=202,
+                content={
+                    "application_id": application_id,
+                    "status": "processing",
+                    "message": "Application accepted, poll /status for results"
+                }
+            )
+        
         # Start processing workflow
         try:
             workflow_result = await master_agent.process(processing_data)
@@ -222,9 +305,9 @@ async def ingest_application(
                         db.commit()
                     
                     # Store extracted data and decision
-                    await _store_workflow_results(db, application_id, workflow_result.data)
+                    await _store_workflow_results(application_id, workflow_result.data)
                     
-                    return {
+                    return ORJSONResponse(content={
                         "application_id": application_id,
                         "status": "processing_completed",
                         "message": "Application processed successfully through AI workflow",
@@ -247,11 +330,11 @@ async def ingest_application(
                                 "documents_provided": len(documents) > 0
                             }
                         }
-                    }
+                    })
                 except Exception as db_error:
-                    logger.warning(f"Database update failed, but AI processing succeeded: {db_error}")
+                    logger.warning("Database update failed, but AI processing succeeded: %s", db_error)
                     # Return success even if database update fails
-                    return {
+                    return ORJSONResponse(content={
                         "application_id": application_id,
                         "status": "processing_completed",
                         "message": "Application processed successfully through AI workflow (demo mode)",
@@ -269,29 +352,29 @@ async def ingest_application(
                                 "Financial profile shows moderate risk"
                             ]
                         }
-                    }
+                    })
             else:
                 # AI workflow has errors - fall back to enhanced validation
-                logger.warning(f"AI workflow completed with errors, falling back to enhanced validation")
+                logger.warning("AI workflow completed with errors, falling back to enhanced validation")
                 # Try to update database if available
                 try:
                     if 'applicant' in locals():
                         applicant.status = "completed_with_errors"
                         db.commit()
                 except Exception as db_error:
-                    logger.warning(f"Database update failed: {db_error}")
+                    logger.warning("Database update failed: %s", db_error)
                 
                 # Fall through to enhanced validation logic below
                 
         except Exception as workflow_error:
-            logger.error(f"AI workflow failed: {workflow_error}")
+            logger.error("AI workflow failed: %s", workflow_error)
             # Try to update database if available
             try:
                 if 'applicant' in locals():
                     applicant.status = "error"
                     db.commit()
             except Exception as db_error:
-                logger.warning(f"Database update failed: {db_error}")
+                logger.warning("Database update failed: %s", db_error)
             
             # Enhanced validation logic (always executed when AI workflow fails or has errors)
             validation_issues = []
@@ -340,9 +423,9 @@ async def ingest_application(
                             
                             if analyzed_docs > 0:
                                 document_relevance_score = total_relevance / analyzed_docs
-                                logger.info(f"AI workflow provided document relevance score: {document_relevance_score}")
+                                logger.info("AI workflow provided document relevance score: %s", document_relevance_score)
                 except Exception as e:
-                    logger.warning(f"Failed to extract AI workflow document analysis: {e}")
+                    logger.warning("Failed to extract AI workflow document analysis: %s", e)
             
             if not documents:
                 validation_issues.append("No supporting documents provided")
@@ -352,22 +435,12 @@ async def ingest_application(
                 if document_relevance_score == 0:
                     # Analyze document relevance
                     for doc_info in documents:
-                        doc_type = doc_info.get('file_type', '').lower()
-                        doc_size = doc_info.get('file_size', 0)
-                        
-                        # Basic file validation - different thresholds for different file types
-                        if doc_type in ['txt', 'csv'] and doc_size < 100:  # Text files can be small
-                            document_issues.append(f"Document {doc_info.get('filename', 'unknown')} suspiciously small")
-                            document_relevance_score -= 20
-                        elif doc_type in ['jpg', 'jpeg', 'png'] and doc_size < 5000:  # Images need more data
-                            document_issues.append(f"Image document {doc_info.get('filename', 'unknown')} too small - may be fake")
-                            document_relevance_score -= 25
-                        elif doc_type == 'pdf' and doc_size < 10000:  # PDFs need substantial content
-                            document_issues.append(f"PDF document {doc_info.get('filename', 'unknown')} too small - may be corrupted")
-                            document_relevance_score -= 20
-                        elif doc_type not in ['txt', 'csv', 'jpg', 'jpeg', 'png', 'pdf'] and doc_size < 1000:  # Generic threshold for other types
-                            document_issues.append(f"Document {doc_info.get('filename', 'unknown')} suspiciously small")
-                            document_relevance_score -= 20
+                        min_size, penalty, issue = DOCUMENT_SIZE_RULES.get(
+                            doc_info.get('file_type', '').lower(), DEFAULT_SIZE_RULE
+                        )
+                        if doc_info.get('file_size', 0) < min_size:
+                            document_issues.append(issue.format(doc_info.get('filename', 'unknown')))
+                            document_relevance_score -= penalty
                     
                     # Add document issues to validation issues
                     validation_issues.extend(document_issues)
@@ -433,7 +506,7 @@ async def ingest_application(
             
             final_validation_score = max(0, min(100, base_score - score_deductions + income_score + doc_score))
             
-            return {
+            return ORJSONResponse(content={
                 "application_id": application_id,
                 "status": "processing_completed",
                 "message": "Application processed with enhanced validation analysis",
@@ -484,10 +557,10 @@ async def ingest_application(
                     "Provide additional documentation" if not documents else "Documentation is complete",
                     "Consider financial counseling" if monthly_income < 40000 else "Financial profile is stable"
                 ]
-            }
+            })
             
     except Exception as e:
-        logger.error(f"Application ingestion failed: {e}")
+        logger.error("Application ingestion failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/status/{application_id}", response_model=ApplicationStatusResponse)
@@ -536,7 +609,7 @@ async def get_application_status(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get application status: {e}")
+        logger.error("Failed to get application status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/decision/{application_id}", response_model=DecisionResponse)
@@ -569,7 +642,7 @@ async def get_application_decision(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get application decision: {e}")
+        logger.error("Failed to get application decision: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/chat/{application_id}", response_model=ChatResponse)
@@ -615,97 +688,233 @@ async def chat_with_application(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Chat failed: {e}")
+        logger.error("Chat failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-async def _store_workflow_results(db: Session, application_id: str, workflow_data: dict):
+async def _run_workflow(application_id: str, processing_data: dict):
+    """Run the AI workflow outside the request and record the outcome"""
+    db = SessionLocal()
+    try:
+        applicant = db.query(Applicant).filter(Applicant.id == application_id).first()
+        try:
+            workflow_result = await master_agent.process(processing_data)
+            workflow_data = workflow_result.data or {}
+            workflow_has_errors = (
+                workflow_data.get('final_status') in ('failed', 'completed_with_errors') or
+                workflow_data.get('total_errors', 0) > 0
+            )
+            
+            # Only write statuses /status reports as final: "completed" needs a stored decision
+            if workflow_result.success and not workflow_has_errors and 'final_decision' in workflow_data:
+                status = "completed"
+            else:
+                status = "error"
+        except Exception as workflow_error:
+            logger.error("Background workflow failed for %s: %s", application_id, workflow_error)
+            workflow_data = {}
+            status = "error"
+        
+        if status == "completed":
+            # A failed write must still leave the applicant in a final state for /status pollers
+            try:
+                await _store_workflow_results(application_id, workflow_data)
+            except Exception as storage_error:
+                logger.error("Storing workflow results failed for %s: %s", application_id, storage_error)
+                status = "error"
+        
+        if applicant:
+            applicant.status = status
+            db.commit()
+    except Exception as db_error:
+        logger.warning("Database update failed for background workflow %s: %s", application_id, db_error)
+        db.rollback()
+        # Last attempt to move the applicant out of "processing"
+        try:
+            db.query(Applicant).filter(Applicant.id == application_id).update({'status': 'error'})
+            db.commit()
+        except Exception as status_error:
+            logger.error("Could not mark application %s as errored: %s", application_id, status_error)
+            db.rollback()
+    finally:
+        db.close()
+
+# Decision payload fields, read in one call once the payload has been normalized
+_decision_payload_fields = itemgetter('features', 'shap_values', 'recommendations')
+
+def _normalize_final_decision(decision_data: dict) -> dict:
+    """Fill in empty payload fields a producer left out, so the itemgetter lookup cannot raise"""
+    return {'features': [], 'shap_values': {}, 'recommendations': [], **decision_data}
+
+async def _store_workflow_results(application_id: str, workflow_data: dict):
+    """Store workflow results in database without blocking the event loop"""
+    # A StaticPool hands every session the same connection, so a worker thread would
+    # interleave with other requests' transactions; write on the loop in that case
+    if isinstance(engine.pool, StaticPool):
+        _store_workflow_results_sync(application_id, workflow_data)
+    else:
+        await asyncio.to_thread(_store_workflow_results_sync, application_id, workflow_data)
+
+def _store_workflow_results_sync(application_id: str, workflow_data: dict):
     """Store workflow results in database"""
+    # The writes get their own session, never a request-scoped one from another thread.
+    # Results are write-only here, so rows go through Core table inserts and
+    # never enter the session's identity map
+    db = SessionLocal()
     try:
         # Store extracted data
         if 'extraction_result' in workflow_data:
             extraction_data = workflow_data['extraction_result']
-            for data_type, content in extraction_data.get('structured_data', {}).items():
-                extracted_record = ExtractedData(
-                    applicant_id=application_id,
-                    data_type=data_type,
-                    extracted_text=str(content),
-                    structured_data=content,
-                    confidence_score=extraction_data.get('confidence', 0.0)
-                )
-                db.add(extracted_record)
+            confidence_score = extraction_data.get('confidence', 0.0)
+            extracted_rows = [
+                {
+                    'applicant_id': application_id,
+                    'data_type': data_type,
+                    'extracted_text': str(content),
+                    'structured_data': content,
+                    'confidence_score': confidence_score
+                }
+                for data_type, content in extraction_data.get('structured_data', {}).items()
+            ]
+            # One multi-row INSERT instead of a statement per record
+            if extracted_rows:
+                db.execute(ExtractedData.__table__.insert(), extracted_rows)
         
         # Store decision
         if 'final_decision' in workflow_data:
-            decision_data = workflow_data['final_decision']
-            decision_record = Decision(
-                applicant_id=application_id,
-                decision=decision_data['decision'],
-                confidence_score=decision_data['confidence'],
-                decision_reason=decision_data['explanation'],
-                model_version=workflow_data.get('model_version', '1.0.0'),
-                features_used=decision_data.get('features', []),
-                shap_values=decision_data.get('shap_values', {}),
-                recommendations=decision_data.get('recommendations', [])
-            )
-            db.add(decision_record)
+            decision_data = _normalize_final_decision(workflow_data['final_decision'])
+            features, shap_values, recommendations = _decision_payload_fields(decision_data)
+            db.execute(Decision.__table__.insert(), [{
+                'applicant_id': application_id,
+                'decision': decision_data['decision'],
+                'confidence_score': decision_data['confidence'],
+                'decision_reason': decision_data['explanation'],
+                'model_version': workflow_data.get('model_version', '1.0.0'),
+                'features_used': features,
+                'shap_values': shap_values,
+                'recommendations': recommendations
+            }])
         
         db.commit()
         
     except Exception as e:
-        logger.error(f"Failed to store workflow results: {e}")
+        logger.error("Failed to store workflow results: %s", e)
         db.rollback()
         raise
+    finally:
+        db.close()
+
+# Chat intent -> trigger keywords, in priority order (earliest wins when several match)
+CHAT_INTENT_KEYWORDS = {
+    'decision': ('decision',),
+    'help': ('help',),
+}
+# One named group per intent so a match reports its intent without lowering the text
+_CHAT_INTENT_PATTERN = re.compile(
+    '|'.join(
+        f"(?P<{intent}>{'|'.join(map(re.escape, keywords))})"
+        for intent, keywords in CHAT_INTENT_KEYWORDS.items()
+    ),
+    re.IGNORECASE
+)
+_TOP_CHAT_INTENT = next(iter(CHAT_INTENT_KEYWORDS))
+
+# Static chat payloads, shared read-only across requests
+_DECISION_CHAT_RESPONSE = MappingProxyType({
+    'confidence': 0.9,
+    'sources': ('application_decision',),
+    'suggestions': ('Check decision details', 'Review recommendations')
+})
+
+_HELP_CHAT_RESPONSE = MappingProxyType({
+    'text': "I can help you with: application status, decision details, recommendations, and general questions about the application process.",
+    'confidence': 0.8,
+    'sources': ('system_knowledge',),
+    'suggestions': ('Ask about specific application details', 'Request recommendations')
+})
 
-async def _generate_chat_response(message: str, context: dict) -> dict:
+_DEFAULT_CHAT_RESPONSE = MappingProxyType({
+    'text': "I understand you're asking about the application. Could you please be more specific? I can help with decision details, recommendations, or application status.",
+    'confidence': 0.6,
+    'sources': ('system_knowledge',),
+    'suggestions': ('Ask about decision', 'Request help', 'Check status')
+})
+
+def _detect_chat_intent(message: str) -> Optional[str]:
+    """Return the highest-priority intent mentioned in the message, if any"""
+    found = set()
+    for match in _CHAT_INTENT_PATTERN.finditer(message):
+        if match.lastgroup == _TOP_CHAT_INTENT:
+            return _TOP_CHAT_INTENT
+        found.add(match.lastgroup)
+    return next((intent for intent in CHAT_INTENT_KEYWORDS if intent in found), None)
+
+def _decision_chat_reply(context: dict) -> Mapping[str, Any]:
+    decision = context.get('decision', 'unknown')
+    return {**_DECISION_CHAT_RESPONSE, 'text': f"The application decision is: {decision}"}
+
+def _help_chat_reply(context: dict) -> Mapping[str, Any]:
+    return _HELP_CHAT_RESPONSE
+
+def _default_chat_reply(context: dict) -> Mapping[str, Any]:
+    return _DEFAULT_CHAT_RESPONSE
+
+# Intent -> reply builder; unknown or missing intents use the default reply
+_CHAT_INTENT_HANDLERS = {
+    'decision': _decision_chat_reply,
+    'help': _help_chat_reply,
+}
+
+async def _generate_chat_response(message: str, context: dict) -> Mapping[str, Any]:
     """Generate chat response based on message and context"""
     # Simplified response generation - in production, this would use the LLM
-    message_lower = message.lower()
-    
-    if 'decision' in message_lower:
-        decision = context.get('decision', 'unknown')
-        return {
-            'text': f"The application decision is: {decision}",
-            'confidence': 0.9,
-            'sources': ['application_decision'],
-            'suggestions': ['Check decision details', 'Review recommendations']
-        }
-    
-    elif 'help' in message_lower:
-        return {
-            'text': "I can help you with: application status, decision details, recommendations, and general questions about the application process.",
-            'confidence': 0.8,
-            'sources': ['system_knowledge'],
-            'suggestions': ['Ask about specific application details', 'Request recommendations']
-        }
-    
-    else:
-        return {
-            'text': "I understand you're asking about the application. Could you please be more specific? I can help with decision details, recommendations, or application status.",
-            'confidence': 0.6,
-            'sources': ['system_knowledge'],
-            'suggestions': ['Ask about decision', 'Request help', 'Check status']
-        }
+    handler = _CHAT_INTENT_HANDLERS.get(_detect_chat_intent(message), _default_chat_reply)
+    return handler(context)
 
 # Error handlers
+# Response skeletons, validated once through ErrorResponse and filled in per exception
+_HTTP_ERROR_BODY = ErrorResponse(error="HTTP Error", message="", details={}).dict()
+_INTERNAL_ERROR_BODY = ErrorResponse(
+    error="Internal Server Error",
+    message="An unexpected error occurred",
+    details={}
+).dict()
+
+@lru_cache(maxsize=64)
+def _http_error_body(status_code: int, detail: str) -> bytes:
+    """Serialized HTTP error body, cached for recurring (status, detail) pairs"""
+    return orjson.dumps({
+        **_HTTP_ERROR_BODY,
+        "message": detail,
+        "details": {"status_code": status_code}
+    })
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    if isinstance(exc.detail, str):
+        return Response(
+            content=_http_error_body(exc.status_code, exc.detail),
+            status_code=exc.status_code,
+            media_type="application/json"
+        )
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=ErrorResponse(
-            error="HTTP Error",
-            message=exc.detail,
-            details={"status_code": exc.status_code}
-        ).dict()
+        content={
+            **_HTTP_ERROR_BODY,
+            "message": exc.detail,
+            "details": {"status_code": exc.status_code}
+        }
     )
 
+@lru_cache(maxsize=64)
+def _internal_error_body(exc_type: type) -> bytes:
+    """Serialized 500 error body, cached per exception type"""
+    return orjson.dumps({**_INTERNAL_ERROR_BODY, "details": {"error_type": exc_type.__name__}})
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return Response(
+        content=_internal_error_body(type(exc)),
         status_code=500,
-        content=ErrorResponse(
-            error="Internal Server Error",
-            message="An unexpected error occurred",
-            details={"error_type": type(exc).__name__}
-        ).dict()
+        media_type="application/json"
     ) 
\ No newline at end of file
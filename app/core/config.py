@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from dataclasses import make_dataclass
+from typing import Optional, Tuple
 import os
 from pathlib import Path
 
@@ -36,7 +37,8 @@ class Settings(BaseSettings):
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
-    cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8501"]
+    io_thread_pool_workers: int = 64
+    cors_origins: Tuple[str, ...] = ("http://localhost:3000", "http://localhost:8501")
     
     # Streamlit Configuration
     streamlit_server_port: int = 8501
@@ -46,12 +48,29 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Ensure directories exist
-        Path(self.upload_dir).mkdir(parents=True, exist_ok=True)
-        Path(self.chroma_persist_directory).mkdir(parents=True, exist_ok=True)
-        Path("logs").mkdir(parents=True, exist_ok=True)
-        Path("models").mkdir(parents=True, exist_ok=True)
+# Frozen snapshot of the parsed settings, shared read-only across the app,
+# with the directory settings pre-parsed into Path objects
+SettingsSnapshot = make_dataclass(
+    "SettingsSnapshot",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()]
+    + [("upload_path", Path), ("chroma_persist_path", Path)],
+    frozen=True
+)
 
-settings = Settings() 
\ No newline at end of file
+def _snapshot(parsed: Settings) -> SettingsSnapshot:
+    """Freeze parsed settings into a SettingsSnapshot"""
+    return SettingsSnapshot(
+        **parsed.model_dump(),
+        upload_path=Path(parsed.upload_dir),
+        chroma_persist_path=Path(parsed.chroma_persist_directory)
+    )
+
+def _ensure_dirs(settings: SettingsSnapshot):
+    """Create the working directories the application writes to"""
+    settings.upload_path.mkdir(parents=True, exist_ok=True)
+    settings.chroma_persist_path.mkdir(parents=True, exist_ok=True)
+    Path("logs").mkdir(parents=True, exist_ok=True)
+    Path("models").mkdir(parents=True, exist_ok=True)
+
+settings = _snapshot(Settings())
+_ensure_dirs(settings) 
\ No newline at end of file
@@ -4,14 +4,25 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from app.core.config import settings
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
-# Create database engine
+def _orjson_dumps(value) -> str:
+    """Serialize JSON/JSONB column values with orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+# Create database engine; SQLite keeps a single shared connection, other databases get a
+# regular connection pool so sessions on different threads never share a connection
+if "sqlite" in settings.database_url:
+    _engine_options = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+else:
+    _engine_options = {}
+
 engine = create_engine(
     settings.database_url,
-    poolclass=StaticPool,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    json_serializer=_orjson_dumps,
+    **_engine_options
 )
 
 # Create session factory
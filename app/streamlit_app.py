@@ -1,13 +1,19 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import hashlib
+import socket
+from urllib.parse import urlsplit
 import pandas as pd
+import numpy as np
 from datetime import datetime
-import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import uuid
-import random # Added for enhanced demo mode
+import re
+from bisect import bisect_left, bisect_right
 
 # Page configuration
 st.set_page_config(
@@ -19,6 +25,68 @@ st.set_page_config(
 
 # Constants
 API_BASE_URL = "http://localhost:8000"
+_API_URL_PARTS = urlsplit(API_BASE_URL)
+API_ADDRESS = (_API_URL_PARTS.hostname, _API_URL_PARTS.port or 80)
+
+# (connect, read) timeouts so a hung backend can't block the script thread indefinitely;
+# /ingest runs the full agent workflow synchronously and gets a longer read window
+BACKEND_TIMEOUT = (2, 15)
+INGEST_TIMEOUT = (2, 120)
+
+# Status panel polling interval, and the statuses after which polling stops
+STATUS_REFRESH_SECONDS = 2
+FINAL_STATUSES = frozenset({"completed", "completed_with_errors", "error"})
+
+# Sidebar pages, with a reverse lookup for the selectbox index
+NAV_PAGES = ("🏠 Dashboard", "📝 Submit Application", "📊 Application Status", "💬 Chat Assistant", "📈 Analytics")
+NAV_INDEX = {page: i for i, page in enumerate(NAV_PAGES)}
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared keep-alive HTTP session for backend calls, reused across reruns"""
+    session = requests.Session()
+    # Retry transient connection failures and gateway errors on idempotent requests only (urllib3 skips
+    # POST by default); once retries run out the last response is returned for the caller to handle
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_data(ttl=10, max_entries=1, show_spinner=False)
+def _backend_health() -> Optional[int]:
+    """Return the backend /health status code, or None if unreachable (cached briefly across reruns)"""
+    # Cheap TCP probe first so an offline backend fails fast instead of waiting on the HTTP timeout
+    try:
+        socket.create_connection(API_ADDRESS, timeout=0.2).close()
+    except OSError:
+        return None
+    
+    try:
+        return get_http_session().get(f"{API_BASE_URL}/health", timeout=1).status_code
+    except requests.exceptions.RequestException:
+        return None
+
+@st.cache_data(ttl=5, max_entries=32, show_spinner=False)
+def _post_ingest(form_items: Tuple[Tuple[str, str], ...], files_digest: str, _files: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """POST an application to /ingest; identical resubmits within a few seconds reuse the response"""
+    response = get_http_session().post(
+        f"{API_BASE_URL}/ingest",
+        data=dict(form_items),  # Send as form data
+        files=_files,
+        timeout=INGEST_TIMEOUT
+    )
+    # Raise on failures so they are never cached and a retry reaches the backend
+    response.raise_for_status()
+    return response.json()
+
+def _uploaded_files_digest(uploaded_files) -> str:
+    """Content hash of the uploaded files, used as the _post_ingest cache key"""
+    digest = hashlib.blake2b(digest_size=16)
+    for uploaded_file in uploaded_files:
+        digest.update(uploaded_file.name.encode())
+        digest.update(uploaded_file.getbuffer())
+    return digest.hexdigest()
 
 def main():
     """Main Streamlit application"""
@@ -32,8 +100,8 @@ def main():
     # Sidebar navigation
     page = st.sidebar.selectbox(
         "Navigation",
-        ["🏠 Dashboard", "📝 Submit Application", "📊 Application Status", "💬 Chat Assistant", "📈 Analytics"],
-        index=["🏠 Dashboard", "📝 Submit Application", "📊 Application Status", "💬 Chat Assistant", "📈 Analytics"].index(st.session_state.navigation)
+        NAV_PAGES,
+        index=NAV_INDEX[st.session_state.navigation]
     )
     
     # Update session state when sidebar changes
@@ -60,15 +128,13 @@ def show_dashboard():
     col1, col2, col3, col4 = st.columns(4)
     
     # Check backend health
-    backend_online = False
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=3)
-        if response.status_code == 200:
-            backend_online = True
-            col1.metric("System Status", "🟢 Online", "Backend Connected")
-        else:
-            col1.metric("System Status", "🟡 Limited", "Backend Error")
-    except:
+    health_status = _backend_health()
+    backend_online = health_status == 200
+    if backend_online:
+        col1.metric("System Status", "🟢 Online", "Backend Connected")
+    elif health_status is not None:
+        col1.metric("System Status", "🟡 Limited", "Backend Error")
+    else:
         col1.metric("System Status", "🔴 Offline", "Backend Unreachable")
     
     # Show demo data when backend is offline
@@ -126,22 +192,93 @@ def show_dashboard():
             "💬 AI chat session started for demo-003"
         ]
         
-        for activity in demo_activities:
-            st.write(f"• {activity}")
+        st.markdown("\n".join(f"- {activity}" for activity in demo_activities))
         
         st.caption("💡 This is demo data. Start the backend to see real activity.")
 
+# File names that suggest a test/fake document
+SUSPICIOUS_RE = re.compile(r"fake|test|sample|dummy|example", re.I)
+
+# Demo risk rules: band boundaries and the (risk delta, factor) for each band.
+# Income and document bands are upper-exclusive, family size bands lower-exclusive.
+INCOME_RISK_BINS = (50000, 80000)
+INCOME_RISK_BANDS = (
+    (30, "Low income relative to family size"),
+    (15, "Moderate income level"),
+    (-10, "Strong income level"),
+)
+EMPLOYMENT_STATUS_RISK = {
+    "Unemployed": (40, "Currently unemployed"),
+    "Self-employed": (20, "Self-employed (variable income)"),
+}
+EMPLOYMENT_LENGTH_RISK_BINS = (12,)
+EMPLOYMENT_LENGTH_RISK_BANDS = (
+    (25, "Short employment history"),
+    (-15, "Stable employment history"),
+)
+FAMILY_SIZE_RISK_BINS = (4, 6)
+FAMILY_SIZE_RISK_BANDS = (
+    (0, None),
+    (10, "Above average family size"),
+    (20, "Large family size"),
+)
+DOCUMENT_COUNT_RISK_BINS = (1, 2)
+DOCUMENT_COUNT_RISK_BANDS = (
+    (25, "No supporting documents"),
+    (15, "Limited documentation"),
+    (0, None),
+)
+
+# Demo recommendations per decision: (st alert method, heading, markdown body)
+DEMO_RECOMMENDATIONS = {
+    "APPROVED": ("success", "**Approval Recommendations:**", (
+        "- Access to full social support benefits\n"
+        "- Consider additional financial planning services\n"
+        "- Explore skill development opportunities"
+    )),
+    "SOFT DECLINE": ("warning", "**Improvement Recommendations:**", (
+        "- Increase income stability (consider additional employment)\n"
+        "- Build credit history through small loans\n"
+        "- Provide additional documentation (bank statements, employment letters)\n"
+        "- Consider family planning for better financial stability\n"
+        "- Explore government training programs"
+    )),
+    "HARD DECLINE": ("error", "**Alternative Support Options:**", (
+        "- Emergency assistance programs\n"
+        "- Food and housing support services\n"
+        "- Job training and placement services\n"
+        "- Financial counseling and debt management\n"
+        "- Community support networks"
+    )),
+}
+
+def _demo_risk_assessment(monthly_income: float, employment_status: str, employment_length_months: int,
+                          family_size: int, document_count: int) -> Tuple[int, List[str]]:
+    """Score the demo-mode risk rules, returning the raw risk score and triggered factors"""
+    bands = (
+        INCOME_RISK_BANDS[bisect_right(INCOME_RISK_BINS, monthly_income)],
+        EMPLOYMENT_STATUS_RISK.get(employment_status)
+        or EMPLOYMENT_LENGTH_RISK_BANDS[bisect_right(EMPLOYMENT_LENGTH_RISK_BINS, employment_length_months)],
+        FAMILY_SIZE_RISK_BANDS[bisect_left(FAMILY_SIZE_RISK_BINS, family_size)],
+        DOCUMENT_COUNT_RISK_BANDS[bisect_right(DOCUMENT_COUNT_RISK_BINS, document_count)],
+    )
+    risk_score = sum(delta for delta, _ in bands)
+    risk_factors = [factor for _, factor in bands if factor]
+    return risk_score, risk_factors
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_importance_fig(items: Tuple[Tuple[str, float], ...], title: Optional[str] = None) -> go.Figure:
+    """Build a horizontal feature-importance bar chart, memoized on its (feature, importance) pairs and title"""
+    fig = go.Figure(go.Bar(x=[importance for _, importance in items], y=[feature for feature, _ in items], orientation='h'))
+    fig.update_layout(title=title, xaxis_title="Importance", yaxis_title="Feature")
+    return fig
+
 def show_application_submission():
     """Show application submission form"""
     st.header("📝 Submit Application")
     
     # Check if backend is online
-    backend_online = False
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=3)
-        backend_online = response.status_code == 200
-    except:
-        pass
+    backend_online = _backend_health() == 200
     
     if not backend_online:
         st.warning("⚠️ Backend API is offline - running in Demo Mode")
@@ -159,6 +296,15 @@ def show_application_submission():
         help="Upload documents like ID, bank statements, pay stubs, etc."
     )
     
+    _application_form(backend_online, uploaded_files)
+    
+    # Debug section (can be removed in production); only serialized when explicitly requested
+    if 'last_ingest_result' in st.session_state and st.checkbox("🔧 Debug: Show raw API response", value=False, key="show_raw"):
+        st.json(st.session_state.last_ingest_result)
+
+@st.fragment
+def _application_form(backend_online: bool, uploaded_files):
+    """Render the application form and handle submission as a fragment, rerunning on its own"""
     with st.form("application_form"):
         st.subheader("Personal Information")
         
@@ -195,7 +341,9 @@ def show_application_submission():
         submitted = st.form_submit_button("Submit Application", use_container_width=True)
         
         if submitted:
-            if not all([first_name, last_name, email, phone, street_address, city, state, postal_code, country, monthly_income, employment_status, family_size]):
+            # family_size is a number_input with min_value=1, so it is always set
+            required = (first_name, last_name, email, phone, street_address, city, state, postal_code, country, monthly_income, employment_status)
+            if not all(required):
                 st.error("Please fill in all required fields marked with *")
             else:
                 if backend_online:
@@ -214,13 +362,13 @@ def show_application_submission():
                         st.info("**Step 1: Document Processing & Extraction**")
                         
                         # Document analysis
+                        document_warnings = set()
                         if uploaded_files:
                             st.write("📄 **Documents Analyzed:**")
-                            document_warnings = []
                             
                             for i, file in enumerate(uploaded_files, 1):
                                 file_type = file.name.split('.')[-1].upper()
-                                file_size = len(file.getvalue())
+                                file_size = file.size
                                 
                                 # Document validation checks
                                 warnings = []
@@ -230,8 +378,7 @@ def show_application_submission():
                                     warnings.append("⚠️ File size suspiciously small - may be fake")
                                 
                                 # Check file names for suspicious patterns
-                                suspicious_keywords = ['fake', 'test', 'sample', 'dummy', 'example']
-                                if any(keyword in file.name.lower() for keyword in suspicious_keywords):
+                                if SUSPICIOUS_RE.search(file.name):
                                     warnings.append("🚨 File name suggests test/fake document")
                                 
                                 # Check for common fake document patterns
@@ -246,7 +393,7 @@ def show_application_submission():
                                     st.write(f"  {i}. {file.name} - {file_type} processed, data extracted")
                                     for warning in warnings:
                                         st.error(f"     {warning}")
-                                        document_warnings.extend(warnings)
+                                    document_warnings.update(warnings)
                                 else:
                                     st.write(f"  {i}. {file.name} - {file_type} processed, data extracted ✅")
                             
@@ -254,8 +401,7 @@ def show_application_submission():
                             if document_warnings:
                                 st.error("🚨 **Document Validation Issues Detected:**")
                                 st.write("The AI system has identified potential issues with uploaded documents:")
-                                for warning in set(document_warnings):  # Remove duplicates
-                                    st.write(f"• {warning}")
+                                st.markdown("\n".join(f"- {warning}" for warning in document_warnings))
                                 st.write("**Impact:** These issues may significantly affect approval chances and require human review.")
                         else:
                             st.warning("⚠️ No documents uploaded - this may affect approval chances")
@@ -287,52 +433,13 @@ def show_application_submission():
                     st.subheader("🎯 AI Decision & Analysis")
                     
                     # Calculate risk factors
-                    risk_score = 0
-                    risk_factors = []
-                    
-                    # Income risk
-                    if monthly_income < 50000:
-                        risk_score += 30
-                        risk_factors.append("Low income relative to family size")
-                    elif monthly_income < 80000:
-                        risk_score += 15
-                        risk_factors.append("Moderate income level")
-                    else:
-                        risk_score -= 10
-                        risk_factors.append("Strong income level")
-                    
-                    # Employment risk
-                    if employment_status == "Unemployed":
-                        risk_score += 40
-                        risk_factors.append("Currently unemployed")
-                    elif employment_status == "Self-employed":
-                        risk_score += 20
-                        risk_factors.append("Self-employed (variable income)")
-                    elif employment_length_months < 12:
-                        risk_score += 25
-                        risk_factors.append("Short employment history")
-                    else:
-                        risk_score -= 15
-                        risk_factors.append("Stable employment history")
-                    
-                    # Family size risk
-                    if family_size > 6:
-                        risk_score += 20
-                        risk_factors.append("Large family size")
-                    elif family_size > 4:
-                        risk_score += 10
-                        risk_factors.append("Above average family size")
-                    
-                    # Document risk
-                    if not uploaded_files:
-                        risk_score += 25
-                        risk_factors.append("No supporting documents")
-                    elif len(uploaded_files) < 2:
-                        risk_score += 15
-                        risk_factors.append("Limited documentation")
+                    risk_score, risk_factors = _demo_risk_assessment(
+                        monthly_income, employment_status, employment_length_months,
+                        family_size, len(uploaded_files or [])
+                    )
                     
                     # Document validation risk (from enhanced demo)
-                    if 'document_warnings' in locals() and document_warnings:
+                    if document_warnings:
                         risk_score += 35
                         risk_factors.append("Document validation issues detected")
                         risk_factors.append("Suspicious or fake documents flagged")
@@ -340,18 +447,22 @@ def show_application_submission():
                     # Normalize risk score
                     risk_score = max(0, min(100, risk_score))
                     
+                    # Confidence jitter seeded by the applicant so demo reruns are reproducible
+                    seed = int.from_bytes(hashlib.blake2b(f"{first_name}|{last_name}|{email}".encode(), digest_size=4).digest(), "little")
+                    jitter = np.random.default_rng(seed).uniform(0, 1)
+                    
                     # Decision logic
                     if risk_score < 30:
                         decision = "APPROVED"
-                        confidence = 0.85 + (random.random() * 0.10)
+                        confidence = 0.85 + (jitter * 0.10)
                         decision_color = "success"
                     elif risk_score < 60:
                         decision = "SOFT DECLINE"
-                        confidence = 0.70 + (random.random() * 0.15)
+                        confidence = 0.70 + (jitter * 0.15)
                         decision_color = "warning"
                     else:
                         decision = "HARD DECLINE"
-                        confidence = 0.60 + (random.random() * 0.20)
+                        confidence = 0.60 + (jitter * 0.20)
                         decision_color = "error"
                     
                     # Display decision
@@ -369,8 +480,8 @@ def show_application_submission():
                     
                     with col2:
                         st.write("**Key Risk Factors:**")
-                        for factor in risk_factors[:5]:  # Show top 5
-                            st.write(f"• {factor}")
+                        # Show top 5
+                        st.markdown("\n".join(f"- {factor}" for factor in risk_factors[:5]))
                     
                     # SHAP-like feature importance
                     st.markdown("---")
@@ -385,60 +496,150 @@ def show_application_submission():
                         "Documentation": 30 if not uploaded_files else 10
                     }
                     
-                    # Normalize feature importance
+                    # Normalize and rank feature importance once for both the list and the chart
                     total_importance = sum(features.values())
                     if total_importance > 0:
-                        features = {k: v/total_importance * 100 for k, v in features.items()}
+                        importance_items = tuple(sorted(
+                            ((k, v/total_importance * 100) for k, v in features.items()),
+                            key=lambda x: x[1], reverse=True
+                        ))
+                    else:
+                        importance_items = tuple(features.items())
                     
                     # Display feature importance
                     col1, col2 = st.columns(2)
                     with col1:
                         st.write("**Feature Importance:**")
-                        for feature, importance in sorted(features.items(), key=lambda x: x[1], reverse=True):
-                            st.write(f"• {feature}: {importance:.1f}%")
+                        st.markdown("\n".join(
+                            f"- {feature}: {importance:.1f}%"
+                            for feature, importance in importance_items
+                        ))
                     
                     with col2:
                         # Create a simple bar chart
-                        import plotly.express as px
-                        feature_df = pd.DataFrame({
-                            'Feature': list(features.keys()),
-                            'Importance': list(features.values())
-                        })
-                        fig = px.bar(feature_df, x='Importance', y='Feature', orientation='h',
-                                    title="Feature Importance Analysis")
+                        fig = _build_importance_fig(importance_items, "Feature Importance Analysis")
                         st.plotly_chart(fig, use_container_width=True)
                     
                     # AI Recommendations
                     st.markdown("---")
                     st.subheader("💡 AI Economic Enablement Recommendations")
                     
-                    if decision == "APPROVED":
-                        st.success("**Approval Recommendations:**")
-                        st.write("• Access to full social support benefits")
-                        st.write("• Consider additional financial planning services")
-                        st.write("• Explore skill development opportunities")
-                    elif decision == "SOFT DECLINE":
-                        st.warning("**Improvement Recommendations:**")
-                        st.write("• Increase income stability (consider additional employment)")
-                        st.write("• Build credit history through small loans")
-                        st.write("• Provide additional documentation (bank statements, employment letters)")
-                        st.write("• Consider family planning for better financial stability")
-                        st.write("• Explore government training programs")
-                    else:
-                        st.error("**Alternative Support Options:**")
-                        st.write("• Emergency assistance programs")
-                        st.write("• Food and housing support services")
-                        st.write("• Job training and placement services")
-                        st.write("• Financial counseling and debt management")
-                        st.write("• Community support networks")
+                    level, title, body = DEMO_RECOMMENDATIONS[decision]
+                    getattr(st, level)(title)
+                    st.markdown(body)
                     
                     st.info("🔧 To enable real AI processing and database storage, start the backend API first.")
 
+# Document relevance score bands (lower-inclusive) and the (st alert method, message) for each band
+DOC_QUALITY_BINS = (40, 60, 80)
+DOC_QUALITY_LEVELS = (
+    ("error", "🔴 **Poor Quality Documents** - Significant impact on approval"),
+    ("warning", "🟠 **Low Quality Documents** - May affect approval chances"),
+    ("warning", "🟡 **Medium Quality Documents** - Adequate but could be improved"),
+    ("success", "🟢 **High Quality Documents** - Excellent supporting evidence"),
+)
+
+# Risk level badges shown with the validation summary: risk_level -> (st alert method, message)
+RISK_PROFILE_BADGES = {
+    'Low': ("success", "🟢 **Low Risk Profile** - Good approval chances"),
+    'Medium': ("warning", "🟡 **Medium Risk Profile** - May require additional documentation"),
+    'High': ("error", "🔴 **High Risk Profile** - Significant challenges identified"),
+}
+
+# Risk analysis per risk_level: (st alert method, message, markdown notes)
+RISK_ANALYSIS_NOTES = {
+    'Low': ("success", "🟢 **Low Risk Profile** - High approval probability", (
+        "- Strong financial profile\n"
+        "- Good documentation\n"
+        "- Stable employment history"
+    )),
+    'Medium': ("warning", "🟡 **Medium Risk Profile** - Moderate approval probability", (
+        "- Some areas for improvement\n"
+        "- May require additional documentation\n"
+        "- Consider income enhancement"
+    )),
+    'High': ("error", "🔴 **High Risk Profile** - Low approval probability", (
+        "- Significant challenges identified\n"
+        "- Requires substantial improvement\n"
+        "- Consider alternative support options"
+    )),
+}
+
+# Workflow execution notes for enhanced vs. standard validation results
+ENHANCED_WORKFLOW_MD = (
+    "- Multi-agent AI system processed the application\n"
+    "- Document extraction and analysis completed\n"
+    "- Cross-validation and conflict resolution performed\n"
+    "- Machine learning model applied for decision making"
+)
+STANDARD_WORKFLOW_MD = (
+    "- Basic validation rules applied\n"
+    "- Enhanced AI workflow not available\n"
+    "- Consider starting backend for full AI processing"
+)
+
+# Static result guidance per decision: (st alert method, heading, markdown body)
+DECISION_RECOMMENDATIONS = {
+    'approved': ("success", "**🎯 Approval Recommendations:**", (
+        "- Access to full social support benefits\n"
+        "- Financial planning and budgeting services\n"
+        "- Skill development and training programs\n"
+        "- Employment advancement opportunities\n"
+        "- Family financial education"
+    )),
+    'soft_decline': ("warning", "**🔧 Improvement Recommendations:**", (
+        "- **Income Enhancement:**\n"
+        "    - Consider additional part-time work\n"
+        "    - Explore skill development for better-paying jobs\n"
+        "    - Look into government training programs\n"
+        "- **Documentation Improvement:**\n"
+        "    - Provide recent bank statements\n"
+        "    - Include employment verification letters\n"
+        "    - Add utility bills for address verification\n"
+        "- **Financial Stability:**\n"
+        "    - Build emergency savings\n"
+        "    - Improve credit score\n"
+        "    - Consider debt consolidation"
+    )),
+    'hard_decline': ("error", "**🚨 Alternative Support Options:**", (
+        "- Emergency assistance programs\n"
+        "- Food and housing support services\n"
+        "- Job training and placement services\n"
+        "- Financial counseling and debt management\n"
+        "- Community support networks\n"
+        "- Government welfare programs"
+    )),
+}
+
+DECISION_NEXT_STEPS = {
+    'approved': ("success", "**Immediate Actions:**", (
+        "1. Complete any required paperwork\n"
+        "2. Schedule follow-up appointments\n"
+        "3. Review benefit details and requirements\n"
+        "4. Set up regular check-ins"
+    )),
+    'soft_decline': ("warning", "**Action Items:**", (
+        "1. Address validation issues identified above\n"
+        "2. Gather additional supporting documents\n"
+        "3. Consider income improvement strategies\n"
+        "4. Reapply in 30-60 days"
+    )),
+    'hard_decline': ("info", "**Support Options:**", (
+        "1. Contact local social services\n"
+        "2. Explore alternative assistance programs\n"
+        "3. Seek financial counseling\n"
+        "4. Consider community resources"
+    )),
+}
+DEFAULT_NEXT_STEPS = DECISION_NEXT_STEPS['hard_decline']
+
 def submit_application(*args):
     """Submit application to the API"""
     try:
-        # Prepare application data
-        application_data = {
+        dob_str = args[15].strftime("%Y-%m-%d")
+        
+        # Prepare form data - FastAPI expects the application as form fields
+        form_data = {
             "first_name": args[0],
             "last_name": args[1],
             "email": args[2],
@@ -448,319 +649,233 @@ def submit_application(*args):
             "state": args[6],
             "postal_code": args[7],
             "country": args[8],
-            "monthly_income": float(args[9]),
+            "monthly_income": str(float(args[9])),
             "employment_status": args[10],
-            "employer_name": args[11] if args[11] else None,
-            "employment_length_months": int(args[12]) if args[12] else None,
-            "family_size": int(args[13]),
-            "dependents": int(args[14]) if args[14] else 0,
-            "date_of_birth": args[15].strftime("%Y-%m-%d")
+            "employer_name": args[11] or "",
+            "employment_length_months": str(int(args[12] or 0)),
+            "family_size": str(int(args[13])),
+            "dependents": str(int(args[14] or 0)),
+            "date_of_birth": dob_str
         }
         
         # Prepare files
         files = []
         for uploaded_file in args[16]:
-            files.append(('files', (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)))
+            # Rewind the buffer; requests reads it in full when it builds the multipart body
+            uploaded_file.seek(0)
+            files.append(('files', (uploaded_file.name, uploaded_file, uploaded_file.type)))
         
         # Submit to API
-        # Prepare form data - FastAPI expects application_data as form fields
-        form_data = {
-            "first_name": application_data["first_name"],
-            "last_name": application_data["last_name"],
-            "email": application_data["email"],
-            "phone": application_data["phone"],
-            "street_address": application_data["street_address"],
-            "city": application_data["city"],
-            "state": application_data["state"],
-            "postal_code": application_data["postal_code"],
-            "country": application_data["country"],
-            "monthly_income": str(application_data["monthly_income"]),
-            "employment_status": application_data["employment_status"],
-            "employer_name": application_data["employer_name"] or "",
-            "employment_length_months": str(application_data["employment_length_months"] or 0),
-            "family_size": str(application_data["family_size"]),
-            "dependents": str(application_data["dependents"]),
-            "date_of_birth": application_data["date_of_birth"]
-        }
-        
-        response = requests.post(
-            f"{API_BASE_URL}/ingest",
-            data=form_data,  # Send as form data
-            files=files
+        result = _post_ingest(
+            tuple(form_data.items()),
+            _uploaded_files_digest(args[16]),
+            files
         )
         
-        if response.status_code == 200:
-            result = response.json()
-            st.success("🎉 Application submitted successfully!")
-            st.info(f"Application ID: {result.get('application_id')}")
-            st.info(f"Status: {result.get('status')}")
+        st.success("🎉 Application submitted successfully!")
+        st.info(f"Application ID: {result.get('application_id')}")
+        st.info(f"Status: {result.get('status')}")
+        
+        # Store application ID in session
+        st.session_state.current_application_id = result.get('application_id')
+        
+        # Display complete analysis results
+        st.markdown("---")
+        st.subheader("🤖 AI Analysis Results")
+        
+        # Decision and reason
+        decision = result.get('decision', 'unknown')
+        decision_reason = result.get('decision_reason', 'No reason provided')
+        
+        if decision == 'approved':
+            st.success(f"✅ **DECISION: APPROVED**")
+        elif decision == 'soft_decline':
+            st.warning(f"⚠️ **DECISION: SOFT DECLINE**")
+        elif decision == 'hard_decline':
+            st.error(f"❌ **DECISION: HARD DECLINE**")
+        else:
+            st.info(f"❓ **DECISION: {decision.upper()}**")
+        
+        st.write(f"**Reason:** {decision_reason}")
+        
+        # Validation summary
+        if 'validation_summary' in result:
+            st.markdown("---")
+            st.subheader("📊 Validation Summary")
             
-            # Store application ID in session
-            st.session_state.current_application_id = result.get('application_id')
+            summary = result['validation_summary']
+            col1, col2, col3, col4 = st.columns(4)
             
-            # Display complete analysis results
-            st.markdown("---")
-            st.subheader("🤖 AI Analysis Results")
+            with col1:
+                st.metric("Validation Score", f"{summary.get('validation_score', 0)}/100")
             
-            # Decision and reason
-            decision = result.get('decision', 'unknown')
-            decision_reason = result.get('decision_reason', 'No reason provided')
+            with col2:
+                st.metric("Risk Level", summary.get('risk_level', 'Unknown'))
             
-            if decision == 'approved':
-                st.success(f"✅ **DECISION: APPROVED**")
-            elif decision == 'soft_decline':
-                st.warning(f"⚠️ **DECISION: SOFT DECLINE**")
-            elif decision == 'hard_decline':
-                st.error(f"❌ **DECISION: HARD DECLINE**")
-            else:
-                st.info(f"❓ **DECISION: {decision.upper()}**")
+            with col3:
+                st.metric("Income Assessment", summary.get('income_assessment', 'Unknown'))
             
-            st.write(f"**Reason:** {decision_reason}")
+            with col4:
+                st.metric("Documents", f"{summary.get('total_documents', 0)}")
             
-            # Validation summary
-            if 'validation_summary' in result:
-                st.markdown("---")
-                st.subheader("📊 Validation Summary")
-                
-                summary = result['validation_summary']
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Validation Score", f"{summary.get('validation_score', 0)}/100")
-                
-                with col2:
-                    st.metric("Risk Level", summary.get('risk_level', 'Unknown'))
-                
-                with col3:
-                    st.metric("Income Assessment", summary.get('income_assessment', 'Unknown'))
-                
-                with col4:
-                    st.metric("Documents", f"{summary.get('total_documents', 0)}")
-                
-                # Risk level color coding
-                risk_level = summary.get('risk_level', 'Unknown')
-                if risk_level == 'Low':
-                    st.success("🟢 **Low Risk Profile** - Good approval chances")
-                elif risk_level == 'Medium':
-                    st.warning("🟡 **Medium Risk Profile** - May require additional documentation")
-                elif risk_level == 'High':
-                    st.error("🔴 **High Risk Profile** - Significant challenges identified")
+            # Risk level color coding
+            risk_badge = RISK_PROFILE_BADGES.get(summary.get('risk_level', 'Unknown'))
+            if risk_badge:
+                level, message = risk_badge
+                getattr(st, level)(message)
+        
+        # Detailed analysis
+        if 'detailed_analysis' in result:
+            st.markdown("---")
+            st.subheader("🔍 Detailed Analysis")
             
-            # Detailed analysis
-            if 'detailed_analysis' in result:
-                st.markdown("---")
-                st.subheader("🔍 Detailed Analysis")
-                
-                analysis = result['detailed_analysis']
-                
-                # Email validation
-                email_valid = analysis.get('email_validation', {})
-                if email_valid.get('valid'):
-                    st.success(f"📧 Email: Valid ✅ (Score: {email_valid.get('score', 0)}/20)")
-                else:
-                    st.error(f"📧 Email: Invalid ❌ (Score: {email_valid.get('score', 0)}/20)")
-                
-                # Phone validation
-                phone_valid = analysis.get('phone_validation', {})
-                if phone_valid.get('valid'):
-                    st.success(f"📱 Phone: Valid ✅ (Score: {phone_valid.get('score', 0)}/20)")
-                else:
-                    st.error(f"📱 Phone: Invalid ❌ (Score: {phone_valid.get('score', 0)}/20)")
-                
-                # Income validation
-                income_valid = analysis.get('income_validation', {})
-                if income_valid.get('valid'):
-                    st.success(f"💰 Income: Valid ✅ (Score: {income_valid.get('score', 0)}/30)")
-                    st.write(f"   Range: {income_valid.get('range', 'Unknown')}")
-                else:
-                    st.error(f"💰 Income: Invalid ❌ (Score: {income_valid.get('score', 0)}/30)")
-                
-                            # Documentation validation
-            doc_valid = analysis.get('documentation_validation', {})
-            if doc_valid.get('provided'):
-                st.success(f"📄 Documents: Provided ✅ (Score: {doc_valid.get('score', 0)}/30)")
-                st.write(f"   Count: {doc_valid.get('count', 0)} documents")
-                
-                # Show document details if available
-                if 'document_relevance_score' in doc_valid:
-                    st.write(f"   Document Relevance: {doc_valid.get('document_relevance_score', 0)}/100")
-                if 'document_quality' in doc_valid:
-                    st.write(f"   Document Quality: {doc_valid.get('document_quality', 'Unknown')}")
-                
-                # Show document issues if any
-                if 'issues' in doc_valid and doc_valid['issues']:
-                    st.write("   **Document Issues:**")
-                    for issue in doc_valid['issues']:
-                        st.write(f"   • {issue}")
-            else:
-                st.warning(f"📄 Documents: Not Provided ⚠️ (Score: {doc_valid.get('score', 0)}/30)")
+            analysis = result['detailed_analysis']
             
-            # Validation issues
-            if 'validation_issues' in result and result['validation_issues']:
-                st.markdown("---")
-                st.subheader("⚠️ Validation Issues")
-                for issue in result['validation_issues']:
-                    st.error(f"• {issue}")
+            # Email validation
+            email_valid = analysis.get('email_validation', {})
+            if email_valid.get('valid'):
+                st.success(f"📧 Email: Valid ✅ (Score: {email_valid.get('score', 0)}/20)")
+            else:
+                st.error(f"📧 Email: Invalid ❌ (Score: {email_valid.get('score', 0)}/20)")
             
-            # Recommendations
-            if 'recommendations' in result and result['recommendations']:
-                st.markdown("---")
-                st.subheader("💡 Recommendations")
-                for rec in result['recommendations']:
-                    st.info(f"• {rec}")
+            # Phone validation
+            phone_valid = analysis.get('phone_validation', {})
+            if phone_valid.get('valid'):
+                st.success(f"📱 Phone: Valid ✅ (Score: {phone_valid.get('score', 0)}/20)")
+            else:
+                st.error(f"📱 Phone: Invalid ❌ (Score: {phone_valid.get('score', 0)}/20)")
             
-            # AI processing info
-            if result.get('ai_processing'):
-                st.markdown("---")
-                st.subheader("🤖 AI Processing Details")
-                st.info(f"Workflow ID: {result.get('workflow_id', 'N/A')}")
-                st.info(f"Enhanced Validation: {'Yes' if result.get('enhanced_validation') else 'No'}")
-                
-                # Show AI workflow status if available
-                if 'workflow_id' in result:
-                    st.info(f"AI Workflow Status: {'Completed' if result.get('ai_processing') else 'Failed'}")
-                
-                # Show confidence scores if available
-                if 'confidence_score' in result:
-                    st.info(f"AI Confidence: {result.get('confidence_score', 'N/A')}")
-                
-                # AI Workflow Execution Details
-                st.write("**AI Workflow Execution:**")
-                
-                # Check if we have workflow execution details
-                if 'workflow_id' in result and result.get('workflow_id', '').startswith('enhanced_'):
-                    st.success("✅ **Enhanced AI Workflow Executed**")
-                    st.write("• Multi-agent AI system processed the application")
-                    st.write("• Document extraction and analysis completed")
-                    st.write("• Cross-validation and conflict resolution performed")
-                    st.write("• Machine learning model applied for decision making")
-                    
-                    # Show workflow steps if available
-                    if 'workflow_steps' in result:
-                        st.write("**Workflow Steps:**")
-                        for i, step in enumerate(result.get('workflow_steps', []), 1):
-                            st.write(f"{i}. {step}")
-                else:
-                    st.info("ℹ️ **Standard Validation Applied**")
-                    st.write("• Basic validation rules applied")
-                    st.write("• Enhanced AI workflow not available")
-                    st.write("• Consider starting backend for full AI processing")
+            # Income validation
+            income_valid = analysis.get('income_validation', {})
+            if income_valid.get('valid'):
+                st.success(f"💰 Income: Valid ✅ (Score: {income_valid.get('score', 0)}/30)")
+                st.write(f"   Range: {income_valid.get('range', 'Unknown')}")
+            else:
+                st.error(f"💰 Income: Invalid ❌ (Score: {income_valid.get('score', 0)}/30)")
             
-            # Enhanced Analysis Section
-            st.markdown("---")
-            st.subheader("🔬 Enhanced AI Analysis")
+                        # Documentation validation
+        doc_valid = analysis.get('documentation_validation', {})
+        if doc_valid.get('provided'):
+            st.success(f"📄 Documents: Provided ✅ (Score: {doc_valid.get('score', 0)}/30)")
+            st.write(f"   Count: {doc_valid.get('count', 0)} documents")
             
-            # Document Analysis (if documents were processed)
-            if 'validation_summary' in result:
-                summary = result['validation_summary']
-                if 'document_relevance_score' in summary:
-                    doc_score = summary.get('document_relevance_score', 0)
-                    doc_quality = summary.get('document_quality', 'Unknown')
-                    
-                    st.write("**Document Quality Analysis:**")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Document Relevance Score", f"{doc_score}/100")
-                    with col2:
-                        st.metric("Document Quality", doc_quality)
-                    
-                    # Document quality assessment
-                    if doc_score >= 80:
-                        st.success("🟢 **High Quality Documents** - Excellent supporting evidence")
-                    elif doc_score >= 60:
-                        st.warning("🟡 **Medium Quality Documents** - Adequate but could be improved")
-                    elif doc_score >= 40:
-                        st.warning("🟠 **Low Quality Documents** - May affect approval chances")
-                    else:
-                        st.error("🔴 **Poor Quality Documents** - Significant impact on approval")
+            # Show document details if available
+            if 'document_relevance_score' in doc_valid:
+                st.write(f"   Document Relevance: {doc_valid.get('document_relevance_score', 0)}/100")
+            if 'document_quality' in doc_valid:
+                st.write(f"   Document Quality: {doc_valid.get('document_quality', 'Unknown')}")
             
-            # Risk Analysis
-            if 'validation_summary' in result:
-                summary = result['validation_summary']
-                risk_level = summary.get('risk_level', 'Unknown')
-                
-                st.write("**Risk Analysis:**")
-                if risk_level == 'Low':
-                    st.success("🟢 **Low Risk Profile** - High approval probability")
-                    st.write("• Strong financial profile")
-                    st.write("• Good documentation")
-                    st.write("• Stable employment history")
-                elif risk_level == 'Medium':
-                    st.warning("🟡 **Medium Risk Profile** - Moderate approval probability")
-                    st.write("• Some areas for improvement")
-                    st.write("• May require additional documentation")
-                    st.write("• Consider income enhancement")
-                elif risk_level == 'High':
-                    st.error("🔴 **High Risk Profile** - Low approval probability")
-                    st.write("• Significant challenges identified")
-                    st.write("• Requires substantial improvement")
-                    st.write("• Consider alternative support options")
+            # Show document issues if any
+            if 'issues' in doc_valid and doc_valid['issues']:
+                st.write("   **Document Issues:**")
+                st.markdown("\n".join(f"- {issue}" for issue in doc_valid['issues']))
+        else:
+            st.warning(f"📄 Documents: Not Provided ⚠️ (Score: {doc_valid.get('score', 0)}/30)")
+        
+        # Validation issues
+        if 'validation_issues' in result and result['validation_issues']:
+            st.markdown("---")
+            st.subheader("⚠️ Validation Issues")
+            for issue in result['validation_issues']:
+                st.error(f"• {issue}")
+        
+        # Recommendations
+        if 'recommendations' in result and result['recommendations']:
+            st.markdown("---")
+            st.subheader("💡 Recommendations")
+            for rec in result['recommendations']:
+                st.info(f"• {rec}")
+        
+        # AI processing info
+        if result.get('ai_processing'):
+            has_workflow = 'workflow_id' in result
+            workflow_id = result.get('workflow_id')
+            is_enhanced = (workflow_id or '').startswith('enhanced_')
             
-            # Economic Enablement Recommendations
             st.markdown("---")
-            st.subheader("💡 Economic Enablement Recommendations")
+            st.subheader("🤖 AI Processing Details")
+            st.info(f"Workflow ID: {workflow_id if has_workflow else 'N/A'}")
+            st.info(f"Enhanced Validation: {'Yes' if result.get('enhanced_validation') else 'No'}")
             
-            decision = result.get('decision', 'unknown')
-            if decision == 'approved':
-                st.success("**🎯 Approval Recommendations:**")
-                st.write("• Access to full social support benefits")
-                st.write("• Financial planning and budgeting services")
-                st.write("• Skill development and training programs")
-                st.write("• Employment advancement opportunities")
-                st.write("• Family financial education")
-            elif decision == 'soft_decline':
-                st.warning("**🔧 Improvement Recommendations:**")
-                st.write("• **Income Enhancement:**")
-                st.write("  - Consider additional part-time work")
-                st.write("  - Explore skill development for better-paying jobs")
-                st.write("  - Look into government training programs")
-                st.write("• **Documentation Improvement:**")
-                st.write("  - Provide recent bank statements")
-                st.write("  - Include employment verification letters")
-                st.write("  - Add utility bills for address verification")
-                st.write("• **Financial Stability:**")
-                st.write("  - Build emergency savings")
-                st.write("  - Improve credit score")
-                st.write("  - Consider debt consolidation")
-            elif decision == 'hard_decline':
-                st.error("**🚨 Alternative Support Options:**")
-                st.write("• Emergency assistance programs")
-                st.write("• Food and housing support services")
-                st.write("• Job training and placement services")
-                st.write("• Financial counseling and debt management")
-                st.write("• Community support networks")
-                st.write("• Government welfare programs")
+            # Show AI workflow status if available
+            if has_workflow:
+                st.info("AI Workflow Status: Completed")
             
-            # Next Steps
-            st.markdown("---")
-            st.subheader("📋 Next Steps")
+            # Show confidence scores if available
+            if 'confidence_score' in result:
+                st.info(f"AI Confidence: {result.get('confidence_score', 'N/A')}")
             
-            if decision == 'approved':
-                st.success("**Immediate Actions:**")
-                st.write("1. Complete any required paperwork")
-                st.write("2. Schedule follow-up appointments")
-                st.write("3. Review benefit details and requirements")
-                st.write("4. Set up regular check-ins")
-            elif decision == 'soft_decline':
-                st.warning("**Action Items:**")
-                st.write("1. Address validation issues identified above")
-                st.write("2. Gather additional supporting documents")
-                st.write("3. Consider income improvement strategies")
-                st.write("4. Reapply in 30-60 days")
-            else:
-                st.info("**Support Options:**")
-                st.write("1. Contact local social services")
-                st.write("2. Explore alternative assistance programs")
-                st.write("3. Seek financial counseling")
-                st.write("4. Consider community resources")
+            # AI Workflow Execution Details
+            st.write("**AI Workflow Execution:**")
             
-            # Debug section (can be removed in production)
-            with st.expander("🔧 Debug: Raw API Response"):
-                st.json(result)
+            # Check if we have workflow execution details
+            if is_enhanced:
+                st.success("✅ **Enhanced AI Workflow Executed**")
+                st.markdown(ENHANCED_WORKFLOW_MD)
+                
+                # Show workflow steps if available
+                if 'workflow_steps' in result:
+                    steps = result['workflow_steps'] or ()
+                    st.write("**Workflow Steps:**")
+                    st.markdown("\n".join(f"{i}. {step}" for i, step in enumerate(steps, 1)))
+            else:
+                st.info("ℹ️ **Standard Validation Applied**")
+                st.markdown(STANDARD_WORKFLOW_MD)
+        
+        # Enhanced Analysis Section
+        st.markdown("---")
+        st.subheader("🔬 Enhanced AI Analysis")
+        
+        summary = result.get('validation_summary')
+        if summary:
+            # Document Analysis (if documents were processed)
+            if 'document_relevance_score' in summary:
+                doc_score = summary.get('document_relevance_score', 0)
+                doc_quality = summary.get('document_quality', 'Unknown')
+                
+                st.write("**Document Quality Analysis:**")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Document Relevance Score", f"{doc_score}/100")
+                with col2:
+                    st.metric("Document Quality", doc_quality)
+                
+                # Document quality assessment
+                level, message = DOC_QUALITY_LEVELS[bisect_right(DOC_QUALITY_BINS, doc_score)]
+                getattr(st, level)(message)
             
-        else:
-            st.error(f"Failed to submit application: {response.text}")
+            # Risk Analysis
+            risk_level = summary.get('risk_level', 'Unknown')
             
+            st.write("**Risk Analysis:**")
+            if risk_level in RISK_ANALYSIS_NOTES:
+                level, message, notes = RISK_ANALYSIS_NOTES[risk_level]
+                getattr(st, level)(message)
+                st.markdown(notes)
+        
+        # Economic Enablement Recommendations
+        st.markdown("---")
+        st.subheader("💡 Economic Enablement Recommendations")
+        
+        decision = result.get('decision', 'unknown')
+        if decision in DECISION_RECOMMENDATIONS:
+            level, title, body = DECISION_RECOMMENDATIONS[decision]
+            getattr(st, level)(title)
+            st.markdown(body)
+        
+        # Next Steps
+        st.markdown("---")
+        st.subheader("📋 Next Steps")
+        
+        level, title, body = DECISION_NEXT_STEPS.get(decision, DEFAULT_NEXT_STEPS)
+        getattr(st, level)(title)
+        st.markdown(body)
+        
+        # Kept for the opt-in debug view rendered below the form
+        st.session_state.last_ingest_result = result
+        
+    except requests.exceptions.HTTPError as e:
+        st.error(f"Failed to submit application: {e.response.text}")
     except Exception as e:
         st.error(f"Error submitting application: {str(e)}")
 
@@ -773,7 +888,7 @@ def show_application_status():
     
     if st.button("Check Status", use_container_width=True):
         if application_id:
-            check_application_status(application_id)
+            st.session_state.status_application_id = application_id
         else:
             st.warning("Please enter an application ID")
     
@@ -781,22 +896,57 @@ def show_application_status():
     if 'current_application_id' in st.session_state:
         st.info(f"Current Application ID: {st.session_state.current_application_id}")
         if st.button("Check Current Application", use_container_width=True):
-            check_application_status(st.session_state.current_application_id)
+            st.session_state.status_application_id = st.session_state.current_application_id
+    
+    # Status lookups are cached for a short while; allow forcing a fresh fetch
+    if st.button("Refresh Status Cache", use_container_width=True):
+        _fetch_status.clear()
+    
+    if 'status_application_id' in st.session_state:
+        application_id = st.session_state.status_application_id
+        # Once an application reaches a final status there is nothing left to poll for
+        if st.session_state.get('status_final_for') == application_id:
+            check_application_status(application_id)
+        else:
+            _status_panel(application_id)
+
+@st.fragment(run_every=STATUS_REFRESH_SECONDS)
+def _status_panel(application_id: str):
+    """Status panel that refreshes on its own without rerunning the rest of the page"""
+    check_application_status(application_id)
+    if st.session_state.get('status_final_for') == application_id:
+        # Rerun the page so the panel is rendered without auto-refresh
+        st.rerun()
+
+@st.cache_data(ttl=STATUS_REFRESH_SECONDS, show_spinner=False)
+def _fetch_status(application_id: str) -> Dict[str, Any]:
+    """Fetch /status for an application, cached briefly so repeated checks skip the round trip"""
+    response = get_http_session().get(f"{API_BASE_URL}/status/{application_id}", timeout=BACKEND_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
 
 def check_application_status(application_id: str):
     """Check and display application status"""
     try:
-        response = requests.get(f"{API_BASE_URL}/status/{application_id}")
+        status_data = _fetch_status(application_id)
+        display_application_status(status_data)
         
-        if response.status_code == 200:
-            status_data = response.json()
-            display_application_status(status_data)
-        else:
-            st.error(f"Failed to get status: {response.text}")
+        applicant_status = status_data.get('applicant', {}).get('status')
+        if status_data.get('overall_status') in FINAL_STATUSES or applicant_status in FINAL_STATUSES:
+            st.session_state.status_final_for = application_id
             
+    except requests.exceptions.HTTPError as e:
+        st.error(f"Failed to get status: {e.response.text}")
     except Exception as e:
         st.error(f"Error checking status: {str(e)}")
 
+DOCUMENT_TABLE_COLUMNS = ('filename', 'file_type', 'processing_status', 'created_at')
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _docs_table(rows: Tuple[Tuple[Any, ...], ...]) -> pd.DataFrame:
+    """Build the documents table, memoized on the projected rows so status polling reuses it"""
+    return pd.DataFrame(list(rows), columns=list(DOCUMENT_TABLE_COLUMNS))
+
 def display_application_status(status_data: Dict[str, Any]):
     """Display application status information"""
     st.subheader("Application Status")
@@ -823,8 +973,8 @@ def display_application_status(status_data: Dict[str, Any]):
     st.subheader("Documents")
     documents = status_data.get('documents', [])
     if documents:
-        doc_df = pd.DataFrame(documents)
-        st.dataframe(doc_df[['filename', 'file_type', 'processing_status', 'created_at']])
+        rows = tuple(tuple(doc.get(column) for column in DOCUMENT_TABLE_COLUMNS) for doc in documents)
+        st.dataframe(_docs_table(rows))
     else:
         st.info("No documents found")
     
@@ -864,8 +1014,7 @@ def display_decision(decision: Dict[str, Any]):
         shap_values = decision.get('shap_values', {})
         if shap_values:
             st.write("**Feature Importance**")
-            shap_df = pd.DataFrame(list(shap_values.items()), columns=['Feature', 'Importance'])
-            fig = px.bar(shap_df, x='Importance', y='Feature', orientation='h')
+            fig = _build_importance_fig(tuple(shap_values.items()))
             st.plotly_chart(fig, use_container_width=True)
     
     # Recommendations
@@ -890,26 +1039,47 @@ def show_chat_assistant():
     # Chat interface
     st.subheader("Chat with AI Assistant")
     
-    # Display chat history
-    for message in st.session_state.chat_history:
-        if message['role'] == 'user':
-            st.write(f"👤 **You:** {message['content']}")
-        else:
-            st.write(f"🤖 **AI:** {message['content']}")
+    # History is rendered into this slot after any new message is handled, so no extra rerun is needed
+    history = st.container()
+    
+    # Chat input - st.chat_input submits atomically and clears itself, returning the text only on the send rerun
+    user_message = st.chat_input("Type your message...")
     
-    # Chat input
-    user_message = st.text_input("Type your message...", key="chat_input")
+    if user_message:
+        send_chat_message(user_message, application_id)
+    
+    # Display chat history (append-only, so earlier message elements stay stable across reruns)
+    with history:
+        for message in st.session_state.chat_history:
+            with st.chat_message(message['role']):
+                st.markdown(message['content'])
     
     col1, col2 = st.columns([1, 4])
     with col1:
-        if st.button("Send", use_container_width=True):
-            if user_message:
-                send_chat_message(user_message, application_id)
-    
-    with col2:
         if st.button("Clear Chat", use_container_width=True):
             st.session_state.chat_history = []
             st.rerun()
+    
+    with col2:
+        if st.button("Clear Reply Cache"):
+            _chat.clear()
+
+CHAT_HISTORY_LIMIT = 200
+
+@st.cache_data(ttl=60, show_spinner="Thinking...")
+def _chat(application_id: str, message: str) -> str:
+    """POST a chat message, caching replies so repeated identical questions skip the backend"""
+    chat_data = {
+        "message": message,
+        "context": {"application_id": application_id}
+    }
+    response = get_http_session().post(
+        f"{API_BASE_URL}/chat/{application_id}",
+        json=chat_data,
+        timeout=BACKEND_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json().get('response', 'No response received')
 
 def send_chat_message(message: str, application_id: str):
     """Send chat message to API"""
@@ -921,35 +1091,23 @@ def send_chat_message(message: str, application_id: str):
         # Add user message to history
         st.session_state.chat_history.append({
             'role': 'user',
-            'content': message,
-            'timestamp': datetime.now()
+            'content': message
         })
         
         # Send to API
-        chat_data = {
-            "message": message,
-            "context": {"application_id": application_id}
-        }
+        reply = _chat(application_id, message)
         
-        response = requests.post(
-            f"{API_BASE_URL}/chat/{application_id}",
-            json=chat_data
-        )
+        # Add AI response to history
+        st.session_state.chat_history.append({
+            'role': 'assistant',
+            'content': reply
+        })
         
-        if response.status_code == 200:
-            result = response.json()
-            
-            # Add AI response to history
-            st.session_state.chat_history.append({
-                'role': 'assistant',
-                'content': result.get('response', 'No response received'),
-                'timestamp': datetime.now()
-            })
-            
-            st.rerun()
-        else:
-            st.error(f"Failed to get response: {response.text}")
+        # Bound session_state growth for long conversations
+        del st.session_state.chat_history[:-CHAT_HISTORY_LIMIT]
             
+    except requests.exceptions.HTTPError as e:
+        st.error(f"Failed to get response: {e.response.text}")
     except Exception as e:
         st.error(f"Error sending message: {str(e)}")
 
@@ -959,7 +1117,10 @@ def show_analytics():
     
     st.info("Analytics dashboard will be implemented in future versions")
     
-    # Placeholder for analytics
+    # Placeholder charts carry no data, so only build them on request
+    if not st.checkbox("Preview charts", value=False):
+        return
+    
     col1, col2 = st.columns(2)
     
     with col1:
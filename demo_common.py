@@ -0,0 +1,80 @@
+"""
+Helpers shared by the root-level demo and smoke-test scripts
+"""
+
+import sys
+import io
+import types
+import functools
+import threading
+from contextlib import contextmanager, redirect_stdout
+
+@functools.lru_cache(maxsize=1)
+def get_master_agent():
+    """Return a MasterAgent, built once per process and shared by every caller"""
+    from app.agents.master_agent import MasterAgent
+    return MasterAgent()
+
+@functools.lru_cache(maxsize=1)
+def load_agent_classes():
+    """Import the agent classes once per process; an ImportError propagates to the caller"""
+    from app.agents.extraction_agent import ExtractionAgent
+    from app.agents.validation_agent import ValidationAgent
+    from app.agents.eligibility_agent import EligibilityAgent
+    from app.agents.recommender_agent import RecommenderAgent
+    from app.agents.master_agent import MasterAgent
+    return types.SimpleNamespace(
+        ExtractionAgent=ExtractionAgent,
+        ValidationAgent=ValidationAgent,
+        EligibilityAgent=EligibilityAgent,
+        RecommenderAgent=RecommenderAgent,
+        MasterAgent=MasterAgent
+    )
+
+def report_failure(label):
+    """Decorator that reports an exception as "<label> failed" and returns False instead of raising"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return bool(func(*args, **kwargs))
+            except Exception as e:
+                print(f"❌ {label} failed: {e}")
+                return False
+        return wrapper
+    return decorator
+
+class ThreadLocalStdout(io.TextIOBase):
+    """Stand-in for sys.stdout that diverts a thread's writes into its own buffer while it captures"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    @contextmanager
+    def capture(self):
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = None
+
+def run_captured(func):
+    """Run one demo or test, returning its result and everything it printed"""
+    # Threads share sys.stdout, so they capture through ThreadLocalStdout; processes can redirect it outright
+    stdout = sys.stdout
+    capture = stdout.capture() if isinstance(stdout, ThreadLocalStdout) else redirect_stdout(io.StringIO())
+    with capture as buffer:
+        try:
+            success = func()
+        except Exception as e:
+            print(f"❌ {func.__name__} crashed: {e}")
+            success = False
+    return success, buffer.getvalue()
@@ -3,20 +3,86 @@
 Demo script for Social Support AI System
 """
 
+import heapq
 import os
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add parent directory to path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Optional pause (seconds) between printed chat answers, e.g. for screen recordings
+DEMO_PACE = float(os.getenv("DEMO_PACE", "0"))
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default (connect, read) timeout to requests that don't set one"""
+    
+    def __init__(self, *args, timeout=(2, 10), **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        # Session.request always passes timeout, as None when the caller left it out
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+# One keep-alive session so the demo's back-to-back API calls reuse a connection;
+# transient gateway errors (e.g. while the backend is starting) are retried
+SESSION = requests.Session()
+SESSION.mount("http://", TimeoutHTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+))
+
+CAPABILITIES = (
+    "Multi-document processing (PDF, images, Excel, text)",
+    "OCR for image-based documents",
+    "Intelligent data extraction and validation",
+    "ML-powered eligibility decisions",
+    "SHAP-based explainability",
+    "Personalized recommendations",
+    "Multi-agent orchestration",
+    "Real-time status tracking",
+    "Interactive chat interface",
+    "Comprehensive audit logging"
+)
+
+TECH_FEATURES = (
+    "FastAPI backend with async processing",
+    "Streamlit UI for user interaction",
+    "PostgreSQL database with audit trails",
+    "Local LLM integration (Ollama)",
+    "Vector database for semantic search",
+    "Containerized deployment ready",
+    "Comprehensive error handling",
+    "Performance monitoring and logging"
+)
+
+# The capability listings are static, so format them once at import time
+_CAPABILITIES_BLOCK = "The system provides the following capabilities:\n" + "\n".join(
+    f"  {i}. {capability}" for i, capability in enumerate(CAPABILITIES, 1)
+)
+_TECH_FEATURES_BLOCK = "\nTechnical Features:\n" + "\n".join(
+    f"  {i}. {feature}" for i, feature in enumerate(TECH_FEATURES, 1)
+)
+
+def _json(response):
+    """Parse a response body with orjson"""
+    return orjson.loads(response.content)
+
 def check_system_health():
     """Check if the system is running"""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = SESSION.get("http://localhost:8000/health")
         if response.status_code == 200:
             print("✅ FastAPI backend is running")
             return True
@@ -59,14 +125,14 @@ def demo_application_submission():
     
     try:
         # Submit application
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/ingest",
             json=sample_application,
-            timeout=30
+            timeout=(2, 30)  # ingestion runs the full workflow before responding
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json(response)
             application_id = result.get('application_id')
             print(f"✅ Application submitted successfully!")
             print(f"Application ID: {application_id}")
@@ -80,7 +146,24 @@ def demo_application_submission():
         print(f"❌ Error submitting application: {e}")
         return None
 
-def demo_status_checking(application_id):
+def _get(url):
+    """GET a URL, returning the response or the exception it raised"""
+    try:
+        return SESSION.get(url)
+    except Exception as e:
+        return e
+
+def wait_for_processing(application_id, max_wait=5.0, interval=0.5):
+    """Poll the status endpoint until processing finishes or max_wait seconds pass"""
+    deadline = time.monotonic() + max_wait
+    while time.monotonic() < deadline:
+        response = _get(f"http://localhost:8000/status/{application_id}")
+        if not isinstance(response, Exception) and response.status_code == 200:
+            if _json(response).get('overall_status') not in ('pending', 'processing'):
+                return
+        time.sleep(interval)
+
+def demo_status_checking(application_id, response=None):
     """Demonstrate application status checking"""
     if not application_id:
         print("❌ No application ID available for status check")
@@ -92,10 +175,13 @@ def demo_status_checking(application_id):
     print("Checking application status...")
     
     try:
-        response = requests.get(f"http://localhost:8000/status/{application_id}", timeout=10)
+        if response is None:
+            response = _get(f"http://localhost:8000/status/{application_id}")
+        if isinstance(response, Exception):
+            raise response
         
         if response.status_code == 200:
-            status_data = response.json()
+            status_data = _json(response)
             print("✅ Status retrieved successfully!")
             
             # Display key information
@@ -111,7 +197,7 @@ def demo_status_checking(application_id):
     except Exception as e:
         print(f"❌ Error checking status: {e}")
 
-def demo_decision_retrieval(application_id):
+def demo_decision_retrieval(application_id, response=None):
     """Demonstrate decision retrieval"""
     if not application_id:
         print("❌ No application ID available for decision retrieval")
@@ -123,10 +209,13 @@ def demo_decision_retrieval(application_id):
     print("Retrieving decision...")
     
     try:
-        response = requests.get(f"http://localhost:8000/decision/{application_id}", timeout=10)
+        if response is None:
+            response = _get(f"http://localhost:8000/decision/{application_id}")
+        if isinstance(response, Exception):
+            raise response
         
         if response.status_code == 200:
-            decision_data = response.json()
+            decision_data = _json(response)
             print("✅ Decision retrieved successfully!")
             
             # Display decision information
@@ -142,7 +231,7 @@ def demo_decision_retrieval(application_id):
             shap_values = decision_data.get('shap_values', {})
             if shap_values:
                 print("\nTop Contributing Factors:")
-                sorted_factors = sorted(shap_values.items(), key=lambda x: x[1], reverse=True)[:3]
+                sorted_factors = heapq.nlargest(3, shap_values.items(), key=lambda x: x[1])
                 for factor, importance in sorted_factors:
                     print(f"  • {factor}: {importance:.1%}")
             
@@ -159,6 +248,23 @@ def demo_decision_retrieval(application_id):
     except Exception as e:
         print(f"❌ Error retrieving decision: {e}")
 
+def _ask_chat(template, application_id, question):
+    """POST one chat question from a prepared template, returning the response or the exception it raised"""
+    chat_data = {
+        "message": question,
+        "context": {"application_id": application_id}
+    }
+    
+    # Copy so concurrent questions don't share a body; only the body and its length change
+    prepared = template.copy()
+    prepared.body = orjson.dumps(chat_data)
+    prepared.headers["Content-Length"] = str(len(prepared.body))
+    
+    try:
+        return SESSION.send(prepared)
+    except Exception as e:
+        return e
+
 def demo_chat_interface(application_id):
     """Demonstrate chat interface"""
     if not application_id:
@@ -175,23 +281,26 @@ def demo_chat_interface(application_id):
         "How can I improve my application for next time?"
     ]
     
-    for question in sample_questions:
+    # URL and headers are the same for every question, so prepare the request once
+    template = SESSION.prepare_request(requests.Request(
+        "POST",
+        f"http://localhost:8000/chat/{application_id}",
+        headers={"Content-Type": "application/json"}
+    ))
+    
+    # Ask all questions at once; the answers are printed in question order below
+    with ThreadPoolExecutor(max_workers=len(sample_questions)) as pool:
+        responses = list(pool.map(lambda question: _ask_chat(template, application_id, question), sample_questions))
+    
+    for question, response in zip(sample_questions, responses):
         print(f"\nQuestion: {question}")
         
         try:
-            chat_data = {
-                "message": question,
-                "context": {"application_id": application_id}
-            }
-            
-            response = requests.post(
-                f"http://localhost:8000/chat/{application_id}",
-                json=chat_data,
-                timeout=10
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json(response)
                 answer = result.get('response', 'No response received')
                 confidence = result.get('confidence', 0.0)
                 
@@ -204,50 +313,20 @@ def demo_chat_interface(application_id):
         except Exception as e:
             print(f"❌ Error in chat: {e}")
         
-        time.sleep(1)  # Brief pause between questions
+        if DEMO_PACE:
+            time.sleep(DEMO_PACE)
 
 def demo_system_capabilities():
     """Demonstrate overall system capabilities"""
-    print("\n🚀 Demo: System Capabilities Overview")
-    print("=" * 40)
-    
-    capabilities = [
-        "Multi-document processing (PDF, images, Excel, text)",
-        "OCR for image-based documents",
-        "Intelligent data extraction and validation",
-        "ML-powered eligibility decisions",
-        "SHAP-based explainability",
-        "Personalized recommendations",
-        "Multi-agent orchestration",
-        "Real-time status tracking",
-        "Interactive chat interface",
-        "Comprehensive audit logging"
-    ]
-    
-    print("The system provides the following capabilities:")
-    for i, capability in enumerate(capabilities, 1):
-        print(f"  {i}. {capability}")
-    
-    print("\nTechnical Features:")
-    tech_features = [
-        "FastAPI backend with async processing",
-        "Streamlit UI for user interaction",
-        "PostgreSQL database with audit trails",
-        "Local LLM integration (Ollama)",
-        "Vector database for semantic search",
-        "Containerized deployment ready",
-        "Comprehensive error handling",
-        "Performance monitoring and logging"
-    ]
-    
-    for i, feature in enumerate(tech_features, 1):
-        print(f"  {i}. {feature}")
+    print("\n🚀 Demo: System Capabilities Overview\n" + "=" * 40)
+    print(_CAPABILITIES_BLOCK)
+    print(_TECH_FEATURES_BLOCK)
 
 def main():
     """Main demo function"""
     print("🤖 Social Support AI System - Demo")
     print("=" * 50)
-    print(f"Demo started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Demo started at: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
     
     # Check system health
     if not check_system_health():
@@ -263,15 +342,20 @@ def main():
         application_id = demo_application_submission()
         
         if application_id:
-            # Wait a bit for processing
+            # Wait for processing, returning early once the backend reports a final status
             print("\n⏳ Waiting for application processing...")
-            time.sleep(5)
+            wait_for_processing(application_id)
+            
+            # Status and decision are independent reads, so fetch them together
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                status_future = pool.submit(_get, f"http://localhost:8000/status/{application_id}")
+                decision_future = pool.submit(_get, f"http://localhost:8000/decision/{application_id}")
             
             # Demo 2: Status checking
-            demo_status_checking(application_id)
+            demo_status_checking(application_id, status_future.result())
             
             # Demo 3: Decision retrieval
-            demo_decision_retrieval(application_id)
+            demo_decision_retrieval(application_id, decision_future.result())
             
             # Demo 4: Chat interface
             demo_chat_interface(application_id)
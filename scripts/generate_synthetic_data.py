@@ -7,14 +7,27 @@ import os
 import sys
 import random
 import json
+import uuid
+import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 # Add parent directory to path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.core.database import get_db, init_db
-from app.models.database_models import Applicant, Document, ExtractedData, Decision
+# Database setup runs at most once per process
+_DB_INITED = False
+
+def seed_generators(seed: Optional[int] = None):
+    """Rebuild the random sources from seed, or from OS entropy when seed is None"""
+    global _RANDOM, _RNG
+    _RANDOM = random.Random(seed)
+    _RNG = np.random.default_rng(seed)
+
+# Every draw goes through _RANDOM and _RNG; set SYNTHETIC_DATA_SEED for a reproducible run
+_SEED = os.environ.get("SYNTHETIC_DATA_SEED")
+seed_generators(int(_SEED) if _SEED else None)
 
 # Indian names data
 INDIAN_FIRST_NAMES = [
@@ -51,56 +64,110 @@ INDIAN_EMPLOYMENT_STATUSES = [
     "Full-time", "Part-time", "Contract", "Freelance", "Self-employed", "Unemployed", "Student", "Retired"
 ]
 
-def generate_synthetic_applicants(n_applicants: int = 100) -> list:
-    """Generate synthetic Indian applicants"""
-    applicants = []
+EMPLOYED_STATUSES = ("Full-time", "Part-time", "Contract")
+
+INDIAN_INCOME_BUCKETS = [15000, 25000, 35000, 45000, 55000, 75000, 95000, 120000, 150000, 200000]
+
+EMAIL_DOMAINS = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']
+
+STREET_TYPES = ('Street', 'Road', 'Lane', 'Avenue', 'Colony', 'Nagar')
+AREA_TYPES = ('Sector', 'Area', 'Block')
+
+INSERT_CHUNK_SIZE = 1000
+
+def generate_synthetic_applicants(n_applicants: int = 100) -> Iterator[Dict[str, Any]]:
+    """Generate synthetic Indian applicants, one at a time"""
+    # Columns are drawn a chunk at a time, so memory stays bounded by INSERT_CHUNK_SIZE
+    for start in range(0, n_applicants, INSERT_CHUNK_SIZE):
+        yield from _generate_applicant_chunk(min(INSERT_CHUNK_SIZE, n_applicants - start))
+
+def _generate_applicant_chunk(n_applicants: int) -> Iterator[Dict[str, Any]]:
+    """Generate one chunk of synthetic Indian applicants from column-wise draws"""
+    # Draw the categorical fields for every applicant in the chunk, one call per field
+    first_names = _RANDOM.choices(INDIAN_FIRST_NAMES, k=n_applicants)
+    last_names = _RANDOM.choices(INDIAN_LAST_NAMES, k=n_applicants)
+    employment_statuses = _RANDOM.choices(INDIAN_EMPLOYMENT_STATUSES, k=n_applicants)
+    employers = _RANDOM.choices(INDIAN_EMPLOYERS, k=n_applicants)
+    cities = _RANDOM.choices(INDIAN_CITIES, k=n_applicants)
+    states = _RANDOM.choices(INDIAN_STATES, k=n_applicants)
+    email_domains = _RANDOM.choices(EMAIL_DOMAINS, k=n_applicants)
+    street_types = _RANDOM.choices(STREET_TYPES, k=n_applicants)
+    area_types = _RANDOM.choices(AREA_TYPES, k=n_applicants)
+    
+    # Numeric fields come from one vectorized draw each; tolist() hands back plain Python numbers
+    rng = _RNG
+    
+    # Derived numeric fields are computed over the whole chunk too, so the loop below only assembles dicts
+    monthly_incomes = np.round(
+        rng.choice(INDIAN_INCOME_BUCKETS, n_applicants) * rng.uniform(0.8, 1.2, n_applicants), 2
+    ).tolist()
+    status_array = np.array(employment_statuses)
+    employment_lengths = np.select(
+        [np.isin(status_array, EMPLOYED_STATUSES), status_array == "Self-employed"],
+        [rng.integers(1, 121, n_applicants), rng.integers(6, 61, n_applicants)],
+        0
+    ).tolist()
+    family_sizes = rng.integers(2, 9, n_applicants)  # Indian families tend to be larger
+    dependents_counts = rng.integers(0, np.minimum(4, family_sizes - 2) + 1).tolist()
+    family_sizes = family_sizes.tolist()
+    phone_numbers = rng.integers(7000000000, 10000000000, n_applicants).tolist()
+    dob_offsets = rng.integers(6570, 21901, n_applicants)  # 18-60 years
+    street_numbers = rng.integers(1, 1000, n_applicants).tolist()
+    area_numbers = rng.integers(1, 21, n_applicants).tolist()
+    postal_codes = rng.integers(100000, 1000000, n_applicants).tolist()
+    created_offsets = rng.integers(0, 31, n_applicants)
+    
+    # One clock read for the whole chunk; synthetic dates don't need per-row precision.
+    # Dates are built as datetime64 columns, giving ISO date strings and datetimes without per-row timedelta math
+    now = datetime.now()
+    dates_of_birth = np.datetime_as_string(np.datetime64(now, 'D') - dob_offsets, unit='D').tolist()
+    created_ats = (np.datetime64(now, 'us') - created_offsets.astype('timedelta64[D]')).tolist()
     
     for i in range(n_applicants):
         # Generate realistic Indian data
-        first_name = random.choice(INDIAN_FIRST_NAMES)
-        last_name = random.choice(INDIAN_LAST_NAMES)
+        first_name = first_names[i]
+        last_name = last_names[i]
         
         # Generate realistic Indian income (in INR)
-        base_income = random.choice([15000, 25000, 35000, 45000, 55000, 75000, 95000, 120000, 150000, 200000])
-        income_variation = random.uniform(0.8, 1.2)
-        monthly_income = round(base_income * income_variation, 2)
+        monthly_income = monthly_incomes[i]
         
         # Generate realistic Indian employment data
-        employment_status = random.choice(INDIAN_EMPLOYMENT_STATUSES)
-        if employment_status in ["Full-time", "Part-time", "Contract"]:
-            employer_name = random.choice(INDIAN_EMPLOYERS)
-            employment_length_months = random.randint(1, 120)
+        employment_status = employment_statuses[i]
+        employment_length_months = employment_lengths[i]
+        if employment_status in EMPLOYED_STATUSES:
+            employer_name = employers[i]
         elif employment_status == "Self-employed":
             employer_name = f"{first_name} {last_name} Enterprises"
-            employment_length_months = random.randint(6, 60)
         else:
             employer_name = None
-            employment_length_months = 0
         
         # Generate realistic Indian family data
-        family_size = random.randint(2, 8)  # Indian families tend to be larger
-        dependents = random.randint(0, min(4, family_size - 2))
+        family_size = family_sizes[i]
+        dependents = dependents_counts[i]
         
         # Generate realistic Indian address
-        city = random.choice(INDIAN_CITIES)
-        state = random.choice(INDIAN_STATES)
+        city = cities[i]
+        state = states[i]
         
         # Generate realistic Indian phone number
-        phone = f"+91 {random.randint(7000000000, 9999999999)}"
+        phone = f"+91 {phone_numbers[i]}"
         
         # Generate realistic Indian email
-        email = f"{first_name.lower()}.{last_name.lower()}@{random.choice(['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com'])}"
+        email = f"{first_name.lower()}.{last_name.lower()}@{email_domains[i]}"
         
+        # Ids are assigned client-side, as the API does, so child rows can reference them
+        # without reading anything back from the database
         applicant = {
+            "id": str(uuid.UUID(int=_RANDOM.getrandbits(128), version=4)),
             "first_name": first_name,
             "last_name": last_name,
-            "date_of_birth": (datetime.now() - timedelta(days=random.randint(6570, 21900))).strftime("%Y-%m-%d"),  # 18-60 years
+            "date_of_birth": dates_of_birth[i],
             "email": email,
             "phone": phone,
-            "street_address": f"{random.randint(1, 999)} {random.choice(['Street', 'Road', 'Lane', 'Avenue', 'Colony', 'Nagar'])}, {random.choice(['Sector', 'Area', 'Block'])} {random.randint(1, 20)}",
+            "street_address": f"{street_numbers[i]} {street_types[i]}, {area_types[i]} {area_numbers[i]}",
             "city": city,
             "state": state,
-            "postal_code": str(random.randint(100000, 999999)),
+            "postal_code": str(postal_codes[i]),
             "country": "India",
             "monthly_income": monthly_income,
             "employment_status": employment_status,
@@ -109,139 +176,203 @@ def generate_synthetic_applicants(n_applicants: int = 100) -> list:
             "family_size": family_size,
             "dependents": dependents,
             "status": "pending",
-            "created_at": datetime.now() - timedelta(days=random.randint(0, 30))
+            "created_at": created_ats[i]
         }
-        applicants.append(applicant)
-    
-    return applicants
+        yield applicant
+
+DOCUMENT_TYPES = ("government_id", "bank_statement", "pay_stub", "utility_bill", "rental_agreement")
+EXTRACTION_METHODS = ("ocr", "pdf_parser", "table_extractor", "text_parser")
 
-def generate_synthetic_documents(applicant_id: str) -> list:
-    """Generate synthetic documents for Indian applicants"""
-    document_types = ["government_id", "bank_statement", "pay_stub", "utility_bill", "rental_agreement"]
-    documents = []
+def generate_synthetic_documents(applicant_ids: List[str]) -> List[Dict[str, Any]]:
+    """Generate synthetic documents for a batch of Indian applicants"""
+    rng = _RNG
+    doc_counts = rng.integers(2, 5, len(applicant_ids)).tolist()
+    
+    # Pick each applicant's document types, then draw the per-document fields for the whole batch at once
+    owners = [
+        (applicant_id, doc_type)
+        for applicant_id, doc_count in zip(applicant_ids, doc_counts)
+        for doc_type in _RANDOM.sample(DOCUMENT_TYPES, doc_count)
+    ]
+    upload_offsets = rng.integers(0, 8, len(owners)).tolist()
+    file_sizes = rng.integers(50000, 500001, len(owners)).tolist()
+    now = datetime.now()
     
-    for doc_type in random.sample(document_types, random.randint(2, 4)):
-        document = {
+    return [
+        {
             "applicant_id": applicant_id,
             "filename": f"{doc_type}_{applicant_id[:8]}.pdf",
             "document_type": doc_type,
-            "upload_date": datetime.now() - timedelta(days=random.randint(0, 7)),
-            "file_size": random.randint(50000, 500000),
+            "upload_date": now - timedelta(days=upload_offset),
+            "file_size": file_size,
             "status": "uploaded"
         }
-        documents.append(document)
+        for (applicant_id, doc_type), upload_offset, file_size in zip(owners, upload_offsets, file_sizes)
+    ]
+
+def generate_synthetic_extracted_data(documents: List[Dict[str, Any]], document_ids: List[Any]) -> List[Dict[str, Any]]:
+    """Generate synthetic extracted data with Indian context, one row per document"""
+    # Fields are drawn a chunk at a time rather than for every document up front
+    extracted_rows = []
+    for start in range(0, len(documents), INSERT_CHUNK_SIZE):
+        stop = start + INSERT_CHUNK_SIZE
+        extracted_rows.extend(_generate_extracted_data_chunk(documents[start:stop], document_ids[start:stop]))
+    return extracted_rows
+
+def _generate_extracted_data_chunk(documents: List[Dict[str, Any]], document_ids: List[Any]) -> List[Dict[str, Any]]:
+    """Generate extracted data rows for one chunk of documents"""
+    n = len(documents)
+    methods = _RANDOM.choices(EXTRACTION_METHODS, k=n)
+    first_names = _RANDOM.choices(INDIAN_FIRST_NAMES, k=n)
+    last_names = _RANDOM.choices(INDIAN_LAST_NAMES, k=n)
+    cities = _RANDOM.choices(INDIAN_CITIES, k=n)
+    employment_statuses = _RANDOM.choices(INDIAN_EMPLOYMENT_STATUSES, k=n)
     
-    return documents
+    rng = _RNG
+    confidences = rng.uniform(0.7, 0.98, n).round(2).tolist()
+    street_numbers = rng.integers(1, 1000, n).tolist()
+    incomes = rng.integers(15000, 200001, n).tolist()
+    hour_offsets = rng.integers(1, 25, n).tolist()
+    processing_times = rng.integers(100, 2001, n).tolist()
+    now = datetime.now()
+    
+    return [
+        {
+            "document_id": document_id,
+            "applicant_id": doc_data["applicant_id"],
+            "extraction_method": methods[i],
+            "confidence_score": confidences[i],
+            "extracted_text": f"Sample extracted text from Indian document {document_id}",
+            "structured_data": {
+                "name": f"{first_names[i]} {last_names[i]}",
+                "address": f"{street_numbers[i]} {cities[i]}",
+                "income": f"₹{incomes[i]:,}",
+                "employment": employment_statuses[i]
+            },
+            "extraction_timestamp": now - timedelta(hours=hour_offsets[i]),
+            "processing_time_ms": processing_times[i]
+        }
+        for i, (doc_data, document_id) in enumerate(zip(documents, document_ids))
+    ]
+
+# Realistic Indian context reasons per decision
+INDIAN_DECISION_REASONS = {
+    "approve": (
+        "Strong employment history with established Indian company",
+        "Good credit score and stable income in INR",
+        "Family size appropriate for income level",
+        "Long-term employment in Indian market"
+    ),
+    "soft_decline": (
+        "Income slightly below threshold for Indian cost of living",
+        "Recent employment change in competitive Indian market",
+        "Family size large relative to income",
+        "Limited credit history in Indian banking system"
+    ),
+    "hard_decline": (
+        "Insufficient income for Indian family size",
+        "Unemployment in competitive Indian job market",
+        "No established credit history in India",
+        "Income below minimum wage requirements"
+    )
+}
+
+DECISION_FEATURES_USED = ("monthly_income", "employment_length_months", "family_size", "dependents")
+
+DECISION_RECOMMENDATIONS = (
+    "Consider Indian government social support programs",
+    "Explore employment opportunities in Indian tech sector",
+    "Build credit history through Indian banking products",
+    "Consider family planning for better financial stability"
+)
 
-def generate_synthetic_extracted_data(applicant_id: str, document_id: str) -> list:
-    """Generate synthetic extracted data with Indian context"""
-    extracted_data = {
-        "document_id": document_id,
-        "applicant_id": applicant_id,
-        "extraction_method": random.choice(["ocr", "pdf_parser", "table_extractor", "text_parser"]),
-        "confidence_score": round(random.uniform(0.7, 0.98), 2),
-        "extracted_text": f"Sample extracted text from Indian document {document_id}",
-        "structured_data": {
-            "name": f"{random.choice(INDIAN_FIRST_NAMES)} {random.choice(INDIAN_LAST_NAMES)}",
-            "address": f"{random.randint(1, 999)} {random.choice(INDIAN_CITIES)}",
-            "income": f"₹{random.randint(15000, 200000):,}",
-            "employment": random.choice(INDIAN_EMPLOYMENT_STATUSES)
-        },
-        "extraction_timestamp": datetime.now() - timedelta(hours=random.randint(1, 24)),
-        "processing_time_ms": random.randint(100, 2000)
-    }
+DECISION_OUTCOMES = ("approve", "soft_decline", "hard_decline")
+DECISION_WEIGHTS = (0.4, 0.4, 0.2)
+
+def generate_synthetic_decisions(applicant_ids: List[str]) -> List[Dict[str, Any]]:
+    """Generate synthetic decisions with Indian context, one row per applicant id given"""
+    n = len(applicant_ids)
+    decisions = _RANDOM.choices(DECISION_OUTCOMES, weights=DECISION_WEIGHTS, k=n)
+    
+    rng = _RNG
+    confidences = rng.uniform(0.6, 0.95, n).round(2).tolist()
+    income_shap = rng.uniform(0.1, 0.4, n).round(3).tolist()
+    employment_shap = rng.uniform(0.05, 0.25, n).round(3).tolist()
+    family_shap = rng.uniform(0.02, 0.15, n).round(3).tolist()
+    dependents_shap = rng.uniform(0.01, 0.1, n).round(3).tolist()
+    hour_offsets = rng.integers(1, 13, n).tolist()
+    now = datetime.now()
     
-    return [extracted_data]
+    return [
+        {
+            "applicant_id": applicant_id,
+            "decision": decision,
+            "confidence_score": confidences[i],
+            "reason": _RANDOM.choice(INDIAN_DECISION_REASONS[decision]),
+            "features_used": DECISION_FEATURES_USED,
+            "shap_values": {
+                "monthly_income": income_shap[i],
+                "employment_length_months": employment_shap[i],
+                "family_size": family_shap[i],
+                "dependents": dependents_shap[i]
+            },
+            "recommendations": DECISION_RECOMMENDATIONS,
+            "decision_timestamp": now - timedelta(hours=hour_offsets[i]),
+            "model_version": "1.0.0"
+        }
+        for i, (applicant_id, decision) in enumerate(zip(applicant_ids, decisions))
+    ]
 
-def generate_synthetic_decisions(applicant_id: str) -> list:
-    """Generate synthetic decisions with Indian context"""
-    decisions = ["approve", "soft_decline", "hard_decline"]
-    decision = random.choices(decisions, weights=[0.4, 0.4, 0.2])[0]
+def _insert_applicant_chunk(db, applicants: List[Dict[str, Any]]):
+    """Bulk-insert one chunk of applicants with their documents, extracted data and decisions"""
+    from sqlalchemy import insert
+    from app.models.database_models import Applicant, Document, ExtractedData, Decision
     
-    # Generate realistic Indian context reasons
-    indian_reasons = {
-        "approve": [
-            "Strong employment history with established Indian company",
-            "Good credit score and stable income in INR",
-            "Family size appropriate for income level",
-            "Long-term employment in Indian market"
-        ],
-        "soft_decline": [
-            "Income slightly below threshold for Indian cost of living",
-            "Recent employment change in competitive Indian market",
-            "Family size large relative to income",
-            "Limited credit history in Indian banking system"
-        ],
-        "hard_decline": [
-            "Insufficient income for Indian family size",
-            "Unemployment in competitive Indian job market",
-            "No established credit history in India",
-            "Income below minimum wage requirements"
-        ]
-    }
+    db.bulk_insert_mappings(Applicant, applicants)
     
-    decision_data = {
-        "applicant_id": applicant_id,
-        "decision": decision,
-        "confidence_score": round(random.uniform(0.6, 0.95), 2),
-        "reason": random.choice(indian_reasons[decision]),
-        "features_used": ["monthly_income", "employment_length_months", "family_size", "dependents"],
-        "shap_values": {
-            "monthly_income": round(random.uniform(0.1, 0.4), 3),
-            "employment_length_months": round(random.uniform(0.05, 0.25), 3),
-            "family_size": round(random.uniform(0.02, 0.15), 3),
-            "dependents": round(random.uniform(0.01, 0.1), 3)
-        },
-        "recommendations": [
-            "Consider Indian government social support programs",
-            "Explore employment opportunities in Indian tech sector",
-            "Build credit history through Indian banking products",
-            "Consider family planning for better financial stability"
-        ],
-        "decision_timestamp": datetime.now() - timedelta(hours=random.randint(1, 12)),
-        "model_version": "1.0.0"
-    }
+    # Generate documents in one multi-row INSERT, reading back the generated ids in row order
+    document_rows = generate_synthetic_documents([applicant_data["id"] for applicant_data in applicants])
+    document_ids = db.scalars(
+        insert(Document).returning(Document.id, sort_by_parameter_order=True),
+        document_rows
+    ).all()
     
-    return [decision_data]
+    # Extracted data and decisions are generated per document, a whole table at a time
+    db.bulk_insert_mappings(ExtractedData, generate_synthetic_extracted_data(document_rows, document_ids))
+    db.bulk_insert_mappings(Decision, generate_synthetic_decisions([doc_data["applicant_id"] for doc_data in document_rows]))
 
-def insert_synthetic_data(applicants: list):
-    """Insert synthetic Indian data into database"""
-    init_db()
+def insert_synthetic_data(applicants: Iterable[Dict[str, Any]]):
+    """Insert synthetic Indian data into database, streaming applicants in chunks"""
+    # Imported here so generating (and declining to insert) doesn't pay for SQLAlchemy and the models
+    from app.core.database import get_db, init_db
+    
+    global _DB_INITED
+    if not _DB_INITED:
+        init_db()
+        _DB_INITED = True
     db = next(get_db())
     
     try:
-        for i, applicant_data in enumerate(applicants):
-            # Create applicant
-            applicant = Applicant(**applicant_data)
-            db.add(applicant)
-            db.commit()
-            db.refresh(applicant)
-            
-            # Generate documents
-            documents = generate_synthetic_documents(applicant.id)
-            for doc_data in documents:
-                document = Document(**doc_data)
-                db.add(document)
-                db.commit()
-                db.refresh(document)
-                
-                # Generate extracted data
-                extracted_data_list = generate_synthetic_extracted_data(applicant.id, document.id)
-                for ext_data in extracted_data_list:
-                    extracted_data = ExtractedData(**ext_data)
-                    db.add(extracted_data)
-                
-                # Generate decisions
-                decisions = generate_synthetic_decisions(applicant.id)
-                for decision_data in decisions:
-                    decision = Decision(**decision_data)
-                    db.add(decision)
-            
-            if (i + 1) % 10 == 0:
-                print(f"✅ Processed {i + 1}/{len(applicants)} Indian applicants")
+        inserted = 0
+        failed = 0
+        applicants = iter(applicants)
+        # One transaction (and one commit) for the whole run; each chunk gets a SAVEPOINT
+        # so a failing chunk is rolled back on its own without losing the others
+        with db.begin():
+            while chunk := list(islice(applicants, INSERT_CHUNK_SIZE)):
+                try:
+                    with db.begin_nested():
+                        _insert_applicant_chunk(db, chunk)
+                except Exception as e:
+                    failed += len(chunk)
+                    print(f"⚠️ Skipped {len(chunk)} applicants: {e}")
+                    continue
+                inserted += len(chunk)
+                print(f"✅ Processed {inserted} Indian applicants")
         
-        db.commit()
-        print(f"🎉 Successfully inserted {len(applicants)} Indian applicants with documents and decisions!")
+        print(f"🎉 Successfully inserted {inserted} Indian applicants with documents and decisions!")
+        if failed:
+            print(f"⚠️ {failed} applicants were rolled back")
         
     except Exception as e:
         print(f"❌ Error inserting data: {e}")
@@ -260,12 +391,11 @@ def main():
     print(f"\n🎲 Generating {n_applicants} Indian applicants...")
     applicants = generate_synthetic_applicants(n_applicants)
     
-    print(f"✅ Generated {len(applicants)} Indian applicants")
-    
-    # Show sample data
-    if applicants:
+    # Show sample data; the rest are generated lazily as they are inserted
+    sample = next(applicants, None)
+    if sample:
+        applicants = chain([sample], applicants)
         print(f"\n📊 Sample Indian Applicant:")
-        sample = applicants[0]
         print(f"   Name: {sample['first_name']} {sample['last_name']}")
         print(f"   City: {sample['city']}, {sample['state']}")
         print(f"   Income: ₹{sample['monthly_income']:,.2f}")
@@ -20,15 +20,13 @@ def check_git_status():
     print("🔍 Checking Git Status...")
     
     try:
-        result = subprocess.run(['git', 'status'], capture_output=True, text=True)
-        if result.returncode == 0:
+        # symbolic-ref only reads HEAD, unlike `git status` which scans the index and working tree.
+        # It exits 1 on a detached HEAD and 128 outside a repository.
+        result = subprocess.run(['git', 'symbolic-ref', '--short', '-q', 'HEAD'], capture_output=True, text=True)
+        if result.returncode in (0, 1):
             print("✅ Git repository initialized")
-            # Fix the f-string syntax issue
-            status_output = result.stdout
-            if 'On branch ' in status_output:
-                branch_line = status_output.split('On branch ')[1]
-                current_branch = branch_line.split('\n')[0]
-                print(f"📝 Current branch: {current_branch}")
+            if result.stdout.strip():
+                print(f"📝 Current branch: {result.stdout.strip()}")
             return True
         else:
             print("❌ Git repository not initialized")
@@ -42,8 +40,8 @@ def check_remote():
     print("\n🌐 Checking Remote Configuration...")
     
     try:
-        result = subprocess.run(['git', 'remote', '-v'], capture_output=True, text=True)
-        if result.returncode == 0 and 'origin' in result.stdout:
+        result = subprocess.run(['git', 'remote', 'get-url', 'origin'], capture_output=True, text=True)
+        if result.returncode == 0:
             print("✅ Remote origin configured")
             print(result.stdout.strip())
             return True
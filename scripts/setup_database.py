@@ -5,52 +5,52 @@ Database setup script for Social Support AI System
 
 import os
 import sys
-import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from urllib.parse import unquote, urlsplit
 
 # Add parent directory to path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.core.config import settings
-
 def create_database():
     """Create the database if it doesn't exist"""
     try:
+        # Imported here so loading the script doesn't pay for psycopg2 and the settings
+        import psycopg2
+        import psycopg2.errors
+        from psycopg2 import sql
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+        from app.core.config import settings
+        
         # Parse connection string to get database name
-        db_url = settings.database_url
-        if db_url.startswith('postgresql://'):
-            # Extract database name from URL
-            parts = db_url.split('/')
-            if len(parts) >= 4:
-                db_name = parts[-1]
-                # Create connection string without database name
-                base_url = '/'.join(parts[:-1])
-                
-                # Connect to PostgreSQL server
-                conn = psycopg2.connect(base_url)
-                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-                cursor = conn.cursor()
-                
-                # Check if database exists
-                cursor.execute("SELECT 1 FROM pg_catalog.pg_database WHERE datname = %s", (db_name,))
-                exists = cursor.fetchone()
-                
-                if not exists:
-                    print(f"Creating database: {db_name}")
-                    cursor.execute(f'CREATE DATABASE "{db_name}"')
-                    print(f"Database '{db_name}' created successfully")
-                else:
-                    print(f"Database '{db_name}' already exists")
-                
-                cursor.close()
-                conn.close()
-            else:
-                print("Invalid database URL format")
-                return False
-        else:
+        url = urlsplit(settings.database_url)
+        if url.scheme != 'postgresql':
             print("Database URL must start with 'postgresql://'")
             return False
-            
+        
+        db_name = url.path.lstrip('/')
+        if not db_name:
+            print("Invalid database URL format")
+            return False
+        
+        # Connect to the server's maintenance database
+        conn = psycopg2.connect(
+            host=url.hostname,
+            port=url.port or 5432,
+            user=unquote(url.username or '') or None,
+            password=unquote(url.password or '') or None,
+            dbname='postgres'
+        )
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        cursor = conn.cursor()
+        
+        # Try the CREATE directly; an existing database is reported by the server, saving a lookup round-trip
+        try:
+            cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name)))
+            print(f"Database '{db_name}' created successfully")
+        except psycopg2.errors.DuplicateDatabase:
+            print(f"Database '{db_name}' already exists")
+        
+        cursor.close()
+        conn.close()
         return True
         
     except Exception as e:
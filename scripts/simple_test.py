@@ -7,11 +7,14 @@ This script tests basic functionality without requiring the full system to be ru
 import sys
 import os
 import json
+import multiprocessing
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from demo_common import load_agent_classes, report_failure, run_captured
+
 def test_imports():
     """Test if we can import the main modules"""
     print("🔍 Testing module imports...")
@@ -58,168 +61,123 @@ def test_imports():
         print(f"❌ Unexpected error: {e}")
         return False
 
+@report_failure("Configuration test")
 def test_configuration():
     """Test configuration loading"""
     print("\n⚙️ Testing configuration...")
     
-    try:
-        from app.core.config import settings
-        
-        print(f"✅ Database URL: {settings.database_url[:50]}...")
-        print(f"✅ Upload directory: {settings.upload_dir}")
-        print(f"✅ Model path: {settings.model_path}")
-        print(f"✅ LLM model: {settings.ollama_model}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        return False
+    from app.core.config import settings
+    
+    print(f"✅ Database URL: {settings.database_url[:50]}...")
+    print(f"✅ Upload directory: {settings.upload_dir}")
+    print(f"✅ Model path: {settings.model_path}")
+    print(f"✅ LLM model: {settings.ollama_model}")
+    
+    return True
 
+@report_failure("Agent creation")
 def test_agent_creation():
     """Test if agents can be instantiated"""
     print("\n🤖 Testing agent creation...")
     
-    try:
-        # Import all agent classes
-        from app.agents.extraction_agent import ExtractionAgent
-        from app.agents.validation_agent import ValidationAgent
-        from app.agents.eligibility_agent import EligibilityAgent
-        from app.agents.recommender_agent import RecommenderAgent
-        from app.agents.master_agent import MasterAgent
-        
-        # Test extraction agent
-        extraction_agent = ExtractionAgent()
-        print(f"✅ Extraction agent created: {extraction_agent.name}")
-        
-        # Test validation agent
-        validation_agent = ValidationAgent()
-        print(f"✅ Validation agent created: {validation_agent.name}")
-        
-        # Test eligibility agent
-        eligibility_agent = EligibilityAgent()
-        print(f"✅ Eligibility agent created: {eligibility_agent.name}")
-        
-        # Test recommender agent
-        recommender_agent = RecommenderAgent()
-        print(f"✅ Recommender agent created: {recommender_agent.name}")
-        
-        # Test master agent
-        master_agent = MasterAgent()
-        print(f"✅ Master agent created: {master_agent.name}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Agent creation failed: {e}")
-        return False
+    agents = load_agent_classes()
+    
+    # Test extraction agent
+    extraction_agent = agents.ExtractionAgent()
+    print(f"✅ Extraction agent created: {extraction_agent.name}")
+    
+    # Test validation agent
+    validation_agent = agents.ValidationAgent()
+    print(f"✅ Validation agent created: {validation_agent.name}")
+    
+    # Test eligibility agent
+    eligibility_agent = agents.EligibilityAgent()
+    print(f"✅ Eligibility agent created: {eligibility_agent.name}")
+    
+    # Test master agent
+    master_agent = agents.MasterAgent()
+    print(f"✅ Master agent created: {master_agent.name}")
+    
+    return True
 
+@report_failure("Data model test")
 def test_data_models():
     """Test data model functionality"""
     print("\n📊 Testing data models...")
     
-    try:
-        from app.models.pydantic_models import ApplicationSubmission, DecisionType
-        
-        # Test application submission model
-        sample_data = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "date_of_birth": "1985-06-15",
-            "email": "john.doe@example.com",
-            "phone": "(555) 123-4567",
-            "street_address": "123 Main Street",
-            "city": "Anytown",
-            "state": "CA",
-            "postal_code": "90210",
-            "country": "United States",
-            "monthly_income": 4500.0,
-            "employment_status": "Full-time",
-            "employer_name": "Tech Solutions Inc",
-            "employment_length_months": 36,
-            "family_size": 3,
-            "dependents": 1
-        }
-        
-        app_submission = ApplicationSubmission(**sample_data)
-        print(f"✅ Application submission model created: {app_submission.first_name} {app_submission.last_name}")
-        
-        # Test decision types
-        decision_types = [dt.value for dt in DecisionType]
-        print(f"✅ Decision types: {decision_types}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Data model test failed: {e}")
-        return False
+    from app.models.pydantic_models import ApplicationSubmission, DecisionType
+    
+    # Test application submission model
+    sample_data = {
+        "first_name": "John",
+        "last_name": "Doe",
+        "date_of_birth": "1985-06-15",
+        "email": "john.doe@example.com",
+        "phone": "(555) 123-4567",
+        "street_address": "123 Main Street",
+        "city": "Anytown",
+        "state": "CA",
+        "postal_code": "90210",
+        "country": "United States",
+        "monthly_income": 4500.0,
+        "employment_status": "Full-time",
+        "employer_name": "Tech Solutions Inc",
+        "employment_length_months": 36,
+        "family_size": 3,
+        "dependents": 1
+    }
+    
+    app_submission = ApplicationSubmission(**sample_data)
+    print(f"✅ Application submission model created: {app_submission.first_name} {app_submission.last_name}")
+    
+    # Test decision types
+    decision_types = [dt.value for dt in DecisionType]
+    print(f"✅ Decision types: {decision_types}")
+    
+    return True
 
+@report_failure("Agent capabilities test")
 def test_agent_capabilities():
     """Test agent capabilities"""
     print("\n🔧 Testing agent capabilities...")
     
-    try:
-        # Import all agent classes
-        from app.agents.extraction_agent import ExtractionAgent
-        from app.agents.validation_agent import ValidationAgent
-        from app.agents.eligibility_agent import EligibilityAgent
-        from app.agents.recommender_agent import RecommenderAgent
-        from app.agents.master_agent import MasterAgent
-        
-        # Test extraction agent capabilities
-        extraction_agent = ExtractionAgent()
-        capabilities = extraction_agent.get_capabilities()
-        print(f"✅ Extraction agent capabilities: {capabilities}")
-        
-        # Test validation agent capabilities
-        validation_agent = ValidationAgent()
-        capabilities = validation_agent.get_capabilities()
-        print(f"✅ Validation agent capabilities: {capabilities}")
-        
-        # Test eligibility agent capabilities
-        eligibility_agent = EligibilityAgent()
-        capabilities = eligibility_agent.get_capabilities()
-        print(f"✅ Eligibility agent capabilities: {capabilities}")
-        
-        # Test recommender agent capabilities
-        recommender_agent = RecommenderAgent()
-        capabilities = recommender_agent.get_capabilities()
-        print(f"✅ Recommender agent capabilities: {capabilities}")
-        
-        # Test master agent capabilities
-        master_agent = MasterAgent()
-        capabilities = master_agent.get_capabilities()
-        print(f"✅ Master agent capabilities: {capabilities}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Agent capabilities test failed: {e}")
-        return False
+    classes = load_agent_classes()
+    
+    # The pipeline agents come from one MasterAgent, and each agent's capabilities are read once
+    master_agent = classes.MasterAgent()
+    agents = {
+        "Extraction": master_agent.agents['extraction'],
+        "Validation": master_agent.agents['validation'],
+        "Eligibility": master_agent.agents['eligibility'],
+        "Recommender": classes.RecommenderAgent(),
+        "Master": master_agent
+    }
+    capabilities = {name: agent.get_capabilities() for name, agent in agents.items()}
+    
+    for name, agent_capabilities in capabilities.items():
+        print(f"✅ {name} agent capabilities: {agent_capabilities}")
+    
+    return True
 
+@report_failure("Synthetic data generation")
 def test_synthetic_data_generation():
     """Test synthetic data generation"""
     print("\n🎲 Testing synthetic data generation...")
     
-    try:
-        from scripts.generate_synthetic_data import generate_synthetic_applicants
-        
-        # Generate a small sample
-        applicants = generate_synthetic_applicants(5)
-        print(f"✅ Generated {len(applicants)} synthetic applicants")
-        
-        # Show sample data
-        if applicants:
-            sample = applicants[0]
-            print(f"✅ Sample applicant: {sample['first_name']} {sample['last_name']}")
-            print(f"   Income: ${sample['monthly_income']:,.2f}")
-            print(f"   Employment: {sample['employment_status']}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Synthetic data generation failed: {e}")
-        return False
+    from scripts.generate_synthetic_data import generate_synthetic_applicants
+    
+    # Generate a small sample (the generator is lazy, so materialize it)
+    applicants = list(generate_synthetic_applicants(5))
+    print(f"✅ Generated {len(applicants)} synthetic applicants")
+    
+    # Show sample data
+    if applicants:
+        sample = applicants[0]
+        print(f"✅ Sample applicant: {sample['first_name']} {sample['last_name']}")
+        print(f"   Income: ${sample['monthly_income']:,.2f}")
+        print(f"   Employment: {sample['employment_status']}")
+    
+    return True
 
 def test_file_structure():
     """Test if all required files exist"""
@@ -244,9 +202,18 @@ def test_file_structure():
         "LICENSE"
     ]
     
+    # List each directory that holds a required file once, rather than stat-ing every file
+    present = set()
+    for directory in {os.path.dirname(file_path) for file_path in required_files}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                present.update(os.path.join(directory, entry.name) for entry in entries)
+        except OSError:
+            pass
+    
     missing_files = []
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_path in present:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path}")
@@ -263,7 +230,7 @@ def main():
     """Main test function"""
     print("🧪 Social Support AI System - Simple Test Suite")
     print("=" * 60)
-    print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Test started at: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
     print()
     
     tests = [
@@ -278,14 +245,16 @@ def main():
     
     results = []
     
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            success = test_func()
-            results.append((test_name, success))
-        except Exception as e:
-            print(f"❌ Test {test_name} crashed: {e}")
-            results.append((test_name, False))
+    # The tests share no state, so run them in separate processes and print
+    # each one's captured output in the usual order
+    test_names, test_funcs = zip(*tests)
+    with multiprocessing.Pool(processes=len(tests)) as pool:
+        outcomes = pool.map(run_captured, test_funcs)
+    
+    for test_name, (success, output) in zip(test_names, outcomes):
+        # Header and captured output go out in one write
+        sys.stdout.write(f"\n{'='*20} {test_name} {'='*20}\n{output}")
+        results.append((test_name, success))
     
     # Summary
     print("\n" + "="*60)
@@ -3,10 +3,8 @@
 Simple test server to verify the system works
 """
 
-import requests
-import time
-import subprocess
 import sys
+from demo_common import get_master_agent, run_captured
 
 def test_imports():
     """Test if we can import the main modules"""
@@ -32,8 +30,9 @@ def test_simple_fastapi():
     print("\n🚀 Testing simple FastAPI server...")
     
     try:
+        import asyncio
+        import httpx
         from fastapi import FastAPI
-        from fastapi.testclient import TestClient
         
         # Create a simple test app
         test_app = FastAPI()
@@ -42,9 +41,13 @@ def test_simple_fastapi():
         def test_endpoint():
             return {"message": "Hello World", "status": "success"}
         
-        # Test with test client
-        client = TestClient(test_app)
-        response = client.get("/test")
+        # Call the app in-process over ASGI; no TestClient portal thread is needed
+        async def get_test():
+            transport = httpx.ASGITransport(app=test_app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return await client.get("/test")
+        
+        response = asyncio.run(get_test())
         
         if response.status_code == 200:
             print("✅ Simple FastAPI test successful")
@@ -63,14 +66,12 @@ def test_agent_system():
     print("\n🤖 Testing agent system...")
     
     try:
-        from app.agents.master_agent import MasterAgent
-        
-        master = MasterAgent()
+        master = get_master_agent()
         print(f"✅ Master agent created: {master.name}")
         print(f"   Sub-agents: {len(master.agents)}")
         
-        for name, agent in master.agents.items():
-            print(f"   • {name}: {agent.name}")
+        for name, agent_name, _ in master.capabilities_summary():
+            print(f"   • {name}: {agent_name}")
         
         return True
         
@@ -92,13 +93,10 @@ def main():
     results = []
     
     for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            success = test_func()
-            results.append((test_name, success))
-        except Exception as e:
-            print(f"❌ Test {test_name} crashed: {e}")
-            results.append((test_name, False))
+        # Buffer each test's output and emit it with its header in one write
+        success, output = run_captured(test_func)
+        sys.stdout.write(f"\n{'='*20} {test_name} {'='*20}\n{output}")
+        results.append((test_name, success))
     
     # Summary
     print("\n" + "="*40)